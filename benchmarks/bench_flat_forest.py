@@ -0,0 +1,64 @@
+"""
+Benchmark the flat-array inference engine against sklearn's predict.
+
+For each shipped model, checks that FlatForest returns bit-for-bit the same output
+as the sklearn estimator, then times both on a single row and on a 10k-row batch.
+The crossover point is what ENGINE_MAX_ROWS in the predict modules is based on.
+
+Run from the repo root:
+    python benchmarks/bench_flat_forest.py
+"""
+import argparse
+import os
+import sys
+import time
+
+import joblib
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.flat_forest import FlatForest  # noqa: E402
+
+MODELS = {
+    "printability": os.path.join("outputs", "models", "printability_model.pkl"),
+    "degradation": os.path.join("degradation_project", "models", "degradation_model.pkl"),
+}
+
+
+def best_time(fn, repeats):
+    """Return the fastest of several timed calls, in milliseconds."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1, 16, 256, 10_000], help="batch sizes to time")
+    parser.add_argument("--repeats", type=int, default=20, help="timed calls per measurement")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    print(f"{'model':<14}{'rows':>8}{'sklearn ms':>12}{'flat ms':>10}{'speedup':>10}  exact")
+    for name, path in MODELS.items():
+        model = joblib.load(path)
+        engine = FlatForest.from_estimator(model)
+        n_features = engine.n_features_in
+
+        for rows in args.rows:
+            X = rng.normal(size=(rows, n_features))
+            exact = np.array_equal(model.predict(X), engine.predict(X))
+            if engine.kind == "classifier":
+                exact = exact and np.array_equal(model.predict_proba(X), engine.predict_proba(X))
+
+            repeats = max(3, args.repeats if rows < 1000 else args.repeats // 5)
+            sk_ms = best_time(lambda: model.predict(X), repeats)
+            flat_ms = best_time(lambda: engine.predict(X), repeats)
+            print(f"{name:<14}{rows:>8}{sk_ms:>12.3f}{flat_ms:>10.3f}{sk_ms / flat_ms:>9.1f}x  {'✅' if exact else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Benchmark inference latency of the shipped models in single-row, batch and concurrent modes.
+
+For each model, batch size and thread count, every thread calls the public predict
+function back to back for a fixed duration (predict_* for one row, predict_*_batch
+otherwise). Reports p50/p95/p99 latency per call and rows/s across all threads. A
+single-threaded tracemalloc pass gives the peak bytes allocated per call.
+
+A per-stage breakdown times the pieces of a prediction on their own: building the
+DataFrame, selecting the feature columns in fit order, the transform and the predict.
+The compiled transform and the dispatching predict used by the predict modules are
+shown next to the sklearn ColumnTransformer and model they replace.
+
+Run from the repo root:
+    python benchmarks/bench_inference.py --json inference.json
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src import predict as printability  # noqa: E402
+from degradation_project import predict as degradation  # noqa: E402
+
+MODELS = {
+    "printability": (printability, printability.predict_printability, printability.predict_printability_batch,
+                     os.path.join("data", "dataset-latest.csv"), ["Printable"]),
+    "degradation": (degradation, degradation.predict_degradation, degradation.predict_degradation_batch,
+                    os.path.join("degradation_project", "data", "degradation_dataset.csv"),
+                    degradation.TARGET_COLUMNS),
+}
+
+
+def load_records(path, targets, rows, seed=42):
+    """Sample `rows` input dicts (with replacement) from the model's dataset."""
+    df = pd.read_csv(path).drop(columns=targets)
+    sample = df.iloc[np.random.default_rng(seed).integers(0, len(df), size=rows)]
+    return sample.to_dict("records")
+
+
+def make_call(predict_one, predict_batch, records):
+    if len(records) == 1:
+        record = records[0]
+        return lambda: predict_one(record)
+    return lambda: predict_batch(records)
+
+
+def run_threads(call, threads, duration):
+    """Call `call` from `threads` threads until `duration` seconds pass; return per-call latencies."""
+    latencies = [[] for _ in range(threads)]
+    stop_at = time.perf_counter() + duration
+
+    def loop(out):
+        while time.perf_counter() < stop_at:
+            start = time.perf_counter()
+            call()
+            out.append(time.perf_counter() - start)
+
+    workers = [threading.Thread(target=loop, args=(out,)) for out in latencies]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return np.concatenate([np.asarray(out) for out in latencies]), time.perf_counter() - start
+
+
+def allocated_per_call(call, calls=5):
+    """Median peak bytes allocated by one call, as seen by tracemalloc."""
+    call()
+    tracemalloc.start()
+    peaks = []
+    try:
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            call()
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+    return float(np.median(peaks))
+
+
+def median_ms(fn, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return float(np.median(times)) * 1000
+
+
+def stage_breakdown(module, records, repeats):
+    """Median milliseconds of each stage of a batch prediction, run one at a time."""
+    compiled = module.get_compiled_preprocessor()
+    preprocessor = module.get_preprocessor()
+    model = module.get_model()
+    columns = compiled.feature_names_in
+
+    df = pd.DataFrame(records)
+    ordered = df[columns]
+    X = compiled.transform(ordered)
+    return {
+        "frame": median_ms(lambda: pd.DataFrame(records), repeats),
+        "reorder": median_ms(lambda: df[columns], repeats),
+        "transform": median_ms(lambda: compiled.transform(ordered), repeats),
+        "transform_sklearn": median_ms(lambda: preprocessor.transform(ordered), repeats),
+        "predict": median_ms(lambda: module._predict(X), repeats),
+        "predict_sklearn": median_ms(lambda: model.predict(X), repeats),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--models", nargs="+", choices=sorted(MODELS), default=sorted(MODELS))
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 16, 256, 10_000])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--duration", type=float, default=2.0, help="seconds per (batch size, threads) run")
+    parser.add_argument("--repeats", type=int, default=20, help="timed calls per stage in the breakdown")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = {"latency": [], "stages": []}
+    for name in args.models:
+        module, predict_one, predict_batch, data_path, targets = MODELS[name]
+        module.warm_up()
+        module.get_model()
+        module.get_preprocessor()
+
+        print(f"\n{name}")
+        print(f"{'rows':>8}{'threads':>9}{'calls':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'rows/s':>12}{'alloc KiB':>11}")
+        for batch_size in args.batch_sizes:
+            records = load_records(data_path, targets, batch_size)
+            call = make_call(predict_one, predict_batch, records)
+            allocated = allocated_per_call(call)
+            for threads in args.threads:
+                latencies, wall = run_threads(call, threads, args.duration)
+                ms = latencies * 1000
+                row = {
+                    "model": name, "batch_size": batch_size, "threads": threads, "calls": len(latencies),
+                    "p50_ms": float(np.percentile(ms, 50)),
+                    "p95_ms": float(np.percentile(ms, 95)),
+                    "p99_ms": float(np.percentile(ms, 99)),
+                    "rows_per_second": len(latencies) * batch_size / wall,
+                    "allocated_bytes_per_call": allocated,
+                }
+                results["latency"].append(row)
+                print(f"{batch_size:>8}{threads:>9}{row['calls']:>8}{row['p50_ms']:>10.3f}{row['p95_ms']:>10.3f}"
+                      f"{row['p99_ms']:>10.3f}{row['rows_per_second']:>12.0f}{allocated / 1024:>11.1f}")
+
+        stage_names = ["frame", "reorder", "transform", "transform_sklearn", "predict", "predict_sklearn"]
+        print(f"\n{'rows':>8}" + "".join(f"{stage:>{len(stage) + 2}}" for stage in stage_names) + "   (median ms)")
+        for batch_size in args.batch_sizes:
+            records = load_records(data_path, targets, batch_size)
+            repeats = args.repeats if batch_size < 1000 else max(3, args.repeats // 5)
+            stages = stage_breakdown(module, records, repeats)
+            results["stages"].append({"model": name, "batch_size": batch_size, "ms": stages})
+            print(f"{batch_size:>8}" + "".join(f"{stages[stage]:>{len(stage) + 2}.3f}" for stage in stage_names))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Compare cold-start cost of the joblib pickles with the memory-mapped flat models.
+
+Starts several worker processes per format. Each worker loads the model, runs one
+prediction so the pages it needs are faulted in, and reports load time and how much
+its memory grew. Workers stay alive until all of them have loaded, so pages that are
+really shared are split between them in the PSS column.
+
+Run from the repo root:
+    python benchmarks/bench_model_load.py --workers 4
+"""
+import argparse
+import json
+import multiprocessing as mp
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+ARTIFACTS = {
+    "printability": (
+        os.path.join("outputs", "models", "printability_model.pkl"),
+        os.path.join("outputs", "models", "printability_model_flat.pkl"),
+    ),
+    "degradation": (
+        os.path.join("degradation_project", "models", "degradation_model.pkl"),
+        os.path.join("degradation_project", "models", "degradation_model_flat.pkl"),
+    ),
+}
+
+
+def _memory_kb():
+    """Read RSS, PSS and private memory of this process from /proc (Linux only)."""
+    fields = {}
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == "kB":
+                    fields[parts[0].rstrip(":")] = int(parts[1])
+    except OSError:
+        return None
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "private": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
+
+
+def _worker(path, flat, barrier, results):
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    import numpy as np
+    import joblib
+    if flat:
+        from src.model import load_flat_model
+    else:
+        import sklearn.ensemble  # noqa: F401  (imported up front so it is not billed to the load)
+
+    before = _memory_kb()
+    start = time.perf_counter()
+    model = load_flat_model(path) if flat else joblib.load(path)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    n_features = model.n_features_in if flat else model.n_features_in_
+    model.predict(np.zeros((1, n_features)))
+    after = _memory_kb()
+
+    barrier.wait()
+    shared_view = _memory_kb()
+    result = {"load_ms": load_ms}
+    if before and after:
+        result["rss_kb"] = after["rss"] - before["rss"]
+        result["private_kb"] = after["private"] - before["private"]
+        result["pss_kb"] = shared_view["pss"] - before["pss"]
+    results.put(result)
+    barrier.wait()
+
+
+def run(path, flat, workers):
+    ctx = mp.get_context("spawn")
+    barrier = ctx.Barrier(workers)
+    results = ctx.Queue()
+    procs = [ctx.Process(target=_worker, args=(path, flat, barrier, results)) for _ in range(workers)]
+    for proc in procs:
+        proc.start()
+    rows = [results.get() for _ in procs]
+    for proc in procs:
+        proc.join()
+
+    summary = {"file_kb": os.path.getsize(os.path.join(ROOT, path)) // 1024}
+    for key in rows[0]:
+        summary[key] = sum(row[key] for row in rows) / len(rows)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workers", type=int, default=4, help="worker processes per format")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    report = {}
+    for name, (pickle_path, flat_path) in ARTIFACTS.items():
+        for label, path, flat in (("pickle", pickle_path, False), ("flat-mmap", flat_path, True)):
+            if not os.path.exists(os.path.join(ROOT, path)):
+                print(f"⚠️ Skipping {name}/{label}: {path} not found")
+                continue
+            report[f"{name}/{label}"] = run(path, flat, args.workers)
+
+    print(f"\n📊 Per-worker averages over {args.workers} workers\n")
+    print(f"{'artifact':<26}{'file KB':>9}{'load ms':>10}{'RSS KB':>10}{'private KB':>12}{'PSS KB':>10}")
+    for key, row in report.items():
+        print(f"{key:<26}{row['file_kb']:>9}{row['load_ms']:>10.1f}"
+              f"{row.get('rss_kb', 0):>10.0f}{row.get('private_kb', 0):>12.0f}{row.get('pss_kb', 0):>10.0f}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"workers": args.workers, "results": report}, f, indent=2)
+        print(f"\n💾 Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Time the training pipelines of both models stage by stage on synthetic data.
+
+For each dataset size a synthetic CSV is generated from the real dataset's schema
+(rows resampled with replacement, float columns jittered by a few percent of their
+spread, so dtypes, categories and label balance match). A fresh subprocess then
+runs the same stages as main.py / degradation_project/main.py, one at a time:
+load, preprocess, fit, predict and dump. Each stage records wall-clock seconds and
+the process's peak RSS once it finishes, so the stage that first drives memory up
+is visible. Results are written as JSON to compare between commits.
+
+Run from the repo root (1M rows takes a long time on few cores):
+    python benchmarks/bench_training.py --rows 1000 100000 1000000 --json training.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+DATASETS = {
+    "printability": os.path.join("data", "dataset-latest.csv"),
+    "degradation": os.path.join("degradation_project", "data", "degradation_dataset.csv"),
+}
+
+
+def make_synthetic(source, rows, seed=42):
+    """Resample the source dataset to `rows` rows, jittering float columns."""
+    rng = np.random.default_rng(seed)
+    df = pd.read_csv(source)
+    synthetic = df.iloc[rng.integers(0, len(df), size=rows)].reset_index(drop=True)
+    for column in df.select_dtypes(include="float64").columns:
+        noise = rng.normal(scale=0.02 * df[column].std(), size=rows)
+        synthetic[column] = (synthetic[column] + noise).round(2)
+    return synthetic
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KB on Linux
+
+
+def timed(stages, name, fn):
+    start = time.perf_counter()
+    result = fn()
+    stages[name] = {"seconds": time.perf_counter() - start, "peak_rss_mb": peak_rss_mb()}
+    return result
+
+
+def run_printability(csv_path, out_dir):
+    import joblib
+    from src.data_preprocessing import load_data, preprocess_data
+    from src.model import train_model
+
+    stages = {}
+    df = timed(stages, "load", lambda: load_data(csv_path))
+    X_train, X_test, y_train, y_test, preprocessor = timed(
+        stages, "preprocess", lambda: preprocess_data(df, "Printable", fit=True))
+    model = timed(stages, "fit", lambda: train_model(X_train, y_train))
+    timed(stages, "predict", lambda: model.predict(X_test))
+    timed(stages, "dump", lambda: (joblib.dump(model, os.path.join(out_dir, "model.pkl")),
+                                   joblib.dump(preprocessor, os.path.join(out_dir, "preprocessor.pkl"))))
+    return stages
+
+
+def run_degradation(csv_path, out_dir):
+    import joblib
+    from sklearn.model_selection import train_test_split
+    from degradation_project.main import build_model, build_preprocessor
+    from degradation_project.src.preprocess import get_feature_columns, get_target_columns, load_degradation_data
+    from src.schema import DEGRADATION_SCHEMA, to_model_dtypes
+
+    stages = {}
+    df = timed(stages, "load", lambda: load_degradation_data(csv_path))
+
+    def preprocess():
+        X = to_model_dtypes(df[get_feature_columns()], DEGRADATION_SCHEMA)
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, df[get_target_columns()], test_size=0.2, random_state=42)
+        preprocessor = build_preprocessor()
+        return preprocessor.fit_transform(X_train), preprocessor.transform(X_test), y_train, preprocessor
+
+    X_train, X_test, y_train, preprocessor = timed(stages, "preprocess", preprocess)
+    model = timed(stages, "fit", lambda: build_model().fit(X_train, y_train))
+    timed(stages, "predict", lambda: model.predict(X_test))
+    timed(stages, "dump", lambda: (joblib.dump(model, os.path.join(out_dir, "model.pkl")),
+                                   joblib.dump(preprocessor, os.path.join(out_dir, "preprocessor.pkl"))))
+    return stages
+
+
+RUNNERS = {"printability": run_printability, "degradation": run_degradation}
+
+
+def worker(dataset, csv_path, out_dir):
+    """Subprocess entry point: run one dataset's stages and print them as JSON."""
+    baseline = peak_rss_mb()
+    stages = RUNNERS[dataset](csv_path, out_dir)
+    print(json.dumps({"baseline_rss_mb": baseline, "stages": stages}))
+
+
+def run_in_subprocess(dataset, csv_path, out_dir):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--worker", dataset, csv_path, out_dir],
+        cwd=ROOT, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--datasets", nargs="+", choices=sorted(DATASETS), default=sorted(DATASETS))
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    parser.add_argument("--worker", nargs=3, metavar=("DATASET", "CSV", "OUT_DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(*args.worker)
+        return
+
+    import sklearn
+    results = []
+    stage_names = ["load", "preprocess", "fit", "predict", "dump"]
+    print(f"{'dataset':<14}{'rows':>10}" + "".join(f"{name + ' s':>13}" for name in stage_names) + f"{'peak MB':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for dataset in args.datasets:
+            for rows in args.rows:
+                csv_path = os.path.join(tmp, f"{dataset}_{rows}.csv")
+                make_synthetic(os.path.join(ROOT, DATASETS[dataset]), rows).to_csv(csv_path, index=False)
+                run = run_in_subprocess(dataset, csv_path, tmp)
+                peaks = [s["peak_rss_mb"] for s in run["stages"].values() if s["peak_rss_mb"] is not None]
+                row = {"dataset": dataset, "rows": rows, **run, "peak_rss_mb": max(peaks) if peaks else None}
+                results.append(row)
+                print(f"{dataset:<14}{rows:>10}"
+                      + "".join(f"{run['stages'][name]['seconds']:>13.3f}" for name in stage_names)
+                      + f"{row['peak_rss_mb'] or 0:>10.0f}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "commit": git_commit(),
+                "python": platform.python_version(),
+                "sklearn": sklearn.__version__,
+                "cpu_count": os.cpu_count(),
+                "results": results,
+            }, f, indent=2)
+        print(f"💾 Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
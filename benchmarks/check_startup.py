@@ -0,0 +1,141 @@
+"""
+Check the import time of each entry point against its startup budget.
+
+For every entry point, the module-level imports (and the sys.path lines they
+rely on) are run in a fresh interpreter under `python -X importtime`, without
+loading models or running the script itself. The import time is the sum of the
+reported per-module times, the median of several runs. The report lists the
+slowest top-level imports, and fails when an entry point is over its budget or
+imports a module its path must not need (plotting and training libraries on
+the prediction paths).
+
+The budgets are milliseconds on a single-core development machine. Use
+--scale on slower hardware instead of editing them.
+
+Run from the repo root (exits with status 1 when a check fails):
+    python benchmarks/check_startup.py
+
+tests/test_startup.py runs the same checks under pytest, with looser budgets.
+"""
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Entry point -> import time budget in ms
+BUDGETS_MS = {
+    "main.py": 3000,
+    "predict.py": 1200,
+    "degradation_project/main.py": 3000,
+    "frontend/app.py": 1500,
+}
+
+# Modules a prediction-only path must not import; sklearn is only needed once a pickled model is loaded
+PREDICTION_FORBIDDEN = ("matplotlib", "seaborn", "torch", "sklearn")
+FORBIDDEN = {
+    "predict.py": PREDICTION_FORBIDDEN,
+    "frontend/app.py": PREDICTION_FORBIDDEN,
+    "main.py": ("matplotlib", "seaborn", "torch"),  # only needed for --plots
+    "degradation_project/main.py": ("matplotlib", "seaborn", "torch"),
+}
+
+
+def import_header(path):
+    """Source of a script's module-level imports and sys.path changes, without the rest of its body."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    header = [
+        node for node in tree.body
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+        or (isinstance(node, ast.Expr) and "sys.path" in ast.unparse(node))
+    ]
+    # Run as the script would be: its own directory first on sys.path and __file__ set
+    prelude = f"__file__ = {path!r}\nimport sys\nsys.path.insert(0, {os.path.dirname(path)!r})\n"
+    return prelude + ast.unparse(ast.Module(body=header, type_ignores=[]))
+
+
+def parse_importtime(stderr):
+    """
+    Parse `-X importtime` output.
+
+    Returns:
+        (total_ms, modules): Sum of the self times, and {module: (self_ms, cumulative_ms, depth)}
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules[name.strip()] = (int(self_us) / 1000, int(cumulative_us) / 1000, depth)
+    return sum(self_ms for self_ms, _, _ in modules.values()), modules
+
+
+def measure(entry_point, repeats):
+    """Median import time of an entry point and the modules imported by its slowest run."""
+    code = import_header(os.path.join(ROOT, entry_point))
+    env = {**os.environ, "MPLBACKEND": "Agg"}
+    runs = []
+    for _ in range(repeats):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, env=env,
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"Importing {entry_point} failed:\n{result.stderr[-2000:]}")
+        runs.append(parse_importtime(result.stderr))
+    total = statistics.median(total for total, _ in runs)
+    return total, max(runs, key=lambda run: run[0])[1]
+
+
+def forbidden_imports(entry_point, modules):
+    """The modules (from measure) that an entry point imports although FORBIDDEN rules them out."""
+    return sorted(name for name in modules
+                  if any(name == banned or name.startswith(banned + ".") for banned in FORBIDDEN[entry_point]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check entry point import times against their budgets.")
+    parser.add_argument("--repeats", type=int, default=5, help="fresh interpreters per entry point")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget, for slower machines")
+    parser.add_argument("--top", type=int, default=5, help="slowest top-level imports to list per entry point")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    # Warm up the bytecode cache so the first entry point is not charged for compiling
+    measure("frontend/app.py", 1)
+
+    failures = []
+    report = {}
+    for entry_point, budget in BUDGETS_MS.items():
+        budget *= args.scale
+        total, modules = measure(entry_point, args.repeats)
+        forbidden = forbidden_imports(entry_point, modules)
+        ok = total <= budget and not forbidden
+        report[entry_point] = {"import_ms": round(total, 1), "budget_ms": budget, "forbidden": forbidden, "ok": ok}
+
+        print(f"{'✅' if ok else '❌'} {entry_point:<30}{total:8.0f} ms  (budget {budget:.0f} ms)")
+        top_level = sorted(((cumulative, name) for name, (_, cumulative, depth) in modules.items() if depth == 0),
+                           reverse=True)
+        for cumulative, name in top_level[:args.top]:
+            print(f"      {name:<40}{cumulative:8.0f} ms")
+        if total > budget:
+            failures.append(f"{entry_point} imports in {total:.0f} ms, over its {budget:.0f} ms budget")
+        if forbidden:
+            banned = sorted({b for b in FORBIDDEN[entry_point] for n in forbidden if n == b or n.startswith(b + ".")})
+            failures.append(f"{entry_point} imports {', '.join(banned)}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if failures:
+        print("\n" + "\n".join(f"❌ {failure}" for failure in failures))
+        sys.exit(1)
+    print("\n✅ All entry points are within their startup budgets")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Compare the per-target degradation forests with a single fused multi-output forest.
+
+Trains both variants exactly as degradation_project/main.py does (with and without
+--fused) and reports, side by side:
+    - R² and MSE per target on the script's held-out split, plus 5-fold CV R²
+      (the held-out split is small, so the CV numbers are the steadier signal)
+    - training time
+    - pickle and flat-model size on disk
+    - prediction latency for one row and a 10k-row batch, through both the sklearn
+      model and the flat engine
+
+Run from the repo root:
+    python benchmarks/compare_degradation_models.py --json fused.json
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.metrics import mean_squared_error, r2_score
+from sklearn.model_selection import KFold, train_test_split
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from degradation_project.main import DATA_PATH, build_model, build_preprocessor  # noqa: E402
+from degradation_project.src.preprocess import get_feature_columns, get_target_columns  # noqa: E402
+from src.flat_forest import FlatForest  # noqa: E402
+
+
+def best_ms(fn, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def cv_r2(model, X, y, folds=5):
+    """Mean out-of-fold R² per target."""
+    scores = []
+    for train, test in KFold(folds, shuffle=True, random_state=42).split(X):
+        preprocessor = build_preprocessor()
+        fitted = clone(model).fit(preprocessor.fit_transform(X.iloc[train]), y.iloc[train])
+        pred = fitted.predict(preprocessor.transform(X.iloc[test]))
+        scores.append(r2_score(y.iloc[test], pred, multioutput="raw_values"))
+    return np.mean(scores, axis=0)
+
+
+def evaluate(name, model, X, y, tmp):
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    preprocessor = build_preprocessor()
+    Xt_train = preprocessor.fit_transform(X_train)
+    Xt_test = preprocessor.transform(X_test)
+
+    start = time.perf_counter()
+    model.fit(Xt_train, y_train)
+    train_seconds = time.perf_counter() - start
+
+    y_pred = model.predict(Xt_test)
+    cv = cv_r2(build_model(fused=name == "fused"), X, y)
+
+    pickle_path = os.path.join(tmp, f"{name}.pkl")
+    flat_path = os.path.join(tmp, f"{name}_flat.pkl")
+    joblib.dump(model, pickle_path)
+    engine = FlatForest.from_estimator(model)
+    joblib.dump(engine, flat_path, compress=0)
+
+    rng = np.random.default_rng(42)
+    one = Xt_test[:1]
+    batch = Xt_train[rng.integers(0, len(Xt_train), size=10_000)]
+    return {
+        "model": name,
+        "n_trees": len(engine.roots),
+        "n_nodes": int(len(engine.feature)),
+        "train_seconds": train_seconds,
+        "pickle_mb": os.path.getsize(pickle_path) / 1e6,
+        "flat_mb": os.path.getsize(flat_path) / 1e6,
+        "targets": {
+            col: {
+                "test_r2": float(r2_score(y_test.iloc[:, i], y_pred[:, i])),
+                "test_mse": float(mean_squared_error(y_test.iloc[:, i], y_pred[:, i])),
+                "cv_r2": float(cv[i]),
+            }
+            for i, col in enumerate(y.columns)
+        },
+        "latency_ms": {
+            "sklearn_1": best_ms(lambda: model.predict(one), 20),
+            "engine_1": best_ms(lambda: engine.predict(one), 20),
+            "sklearn_10k": best_ms(lambda: model.predict(batch), 3),
+            "engine_10k": best_ms(lambda: engine.predict(batch), 3),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    df = pd.read_csv(DATA_PATH)
+    X, y = df[get_feature_columns()], df[get_target_columns()]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = [evaluate(name, build_model(fused=name == "fused"), X, y, tmp)
+                   for name in ("per-target", "fused")]
+
+    print(f"{'':<28}" + "".join(f"{r['model']:>14}" for r in results))
+    for key, label, fmt in [("n_trees", "trees", "d"), ("n_nodes", "nodes", "d"),
+                            ("train_seconds", "train s", ".3f"), ("pickle_mb", "pickle MB", ".3f"),
+                            ("flat_mb", "flat MB", ".3f")]:
+        print(f"{label:<28}" + "".join(f"{r[key]:>14{fmt}}" for r in results))
+    for key in results[0]["latency_ms"]:
+        print(f"{key + ' ms':<28}" + "".join(f"{r['latency_ms'][key]:>14.3f}" for r in results))
+    for col in y.columns:
+        for metric in ("test_r2", "cv_r2", "test_mse"):
+            label = f"{col.split('_')[0]} {metric}"
+            print(f"{label:<28}" + "".join(f"{r['targets'][col][metric]:>14.3f}" for r in results))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Load generator for the local inference server (serve.py).
+
+Sends single-row prediction requests from a growing number of concurrent clients,
+each on its own keep-alive connection, and reports p50/p99 latency and throughput
+per concurrency level.
+
+Start the server, then run from the repo root:
+    python serve.py --port 8000
+    python benchmarks/load_generator.py --port 8000 --concurrency 1 4 16 64
+
+The requests replay dataset rows, so start the server with --no-memo to measure
+the models rather than the prediction cache.
+"""
+import argparse
+import http.client
+import json
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+DATASETS = {
+    "printability": ("data/dataset-latest.csv", ["Printable"]),
+    "degradation": ("degradation_project/data/degradation_dataset.csv", [
+        "Compressive_Stiffness_MPa", "Weight_Loss_Percentage", "Water_Absorption_Percentage"
+    ]),
+}
+
+
+def load_payloads(model):
+    """Turn the model's dataset into JSON request bodies, one row each."""
+    path, targets = DATASETS[model]
+    records = pd.read_csv(path).drop(columns=targets).to_dict("records")
+    return [json.dumps(record).encode() for record in records]
+
+
+def client(host, port, model, payloads, stop_at, latencies, errors):
+    conn = http.client.HTTPConnection(host, port)
+    i = 0
+    while time.perf_counter() < stop_at:
+        body = payloads[i % len(payloads)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            conn.request("POST", f"/predict/{model}", body, {"Content-Type": "application/json"})
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                errors.append(response.status)
+                continue
+        except (OSError, http.client.HTTPException) as e:
+            errors.append(str(e))
+            conn.close()
+            conn = http.client.HTTPConnection(host, port)
+            continue
+        latencies.append(time.perf_counter() - start)
+    conn.close()
+
+
+def run_level(host, port, model, payloads, concurrency, duration):
+    latencies, errors = [], []
+    stop_at = time.perf_counter() + duration
+    threads = [
+        threading.Thread(target=client, args=(host, port, model, payloads, stop_at, latencies, errors))
+        for _ in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    ms = np.asarray(latencies) * 1000
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": len(errors),
+        "throughput_rps": len(latencies) / duration,
+        "p50_ms": float(np.percentile(ms, 50)) if len(ms) else None,
+        "p99_ms": float(np.percentile(ms, 99)) if len(ms) else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--model", choices=sorted(DATASETS), default="printability")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per concurrency level")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    payloads = load_payloads(args.model)
+    results = []
+    print(f"{'clients':>8}{'requests':>10}{'errors':>8}{'req/s':>10}{'p50 ms':>9}{'p99 ms':>9}")
+    for concurrency in args.concurrency:
+        row = run_level(args.host, args.port, args.model, payloads, concurrency, args.duration)
+        results.append(row)
+        print(f"{row['concurrency']:>8}{row['requests']:>10}{row['errors']:>8}{row['throughput_rps']:>10.1f}"
+              f"{row['p50_ms'] or 0:>9.2f}{row['p99_ms'] or 0:>9.2f}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"model": args.model, "results": results}, f, indent=2)
+        print(f"💾 Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
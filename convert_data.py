@@ -0,0 +1,56 @@
+import argparse
+import glob
+import os
+import time
+
+import pandas as pd
+
+from src.schema import read_dataset, schema_for
+
+DEFAULT_INPUTS = [os.path.join("data", "*.csv"), os.path.join("degradation_project", "data", "*.csv")]
+
+
+def convert(csv_path, formats):
+    """
+    Write typed Parquet and/or Feather copies next to a CSV dataset.
+
+    Parameters:
+        csv_path (str): Dataset CSV; its schema is chosen from the header
+        formats (list of str): "parquet" and/or "feather"
+
+    Returns:
+        list of str: Paths written
+    """
+    schema = schema_for(pd.read_csv(csv_path, nrows=0).columns)
+    df = read_dataset(csv_path, schema)
+    base = os.path.splitext(csv_path)[0]
+    written = []
+    if "parquet" in formats:
+        df.to_parquet(base + ".parquet", index=False)
+        written.append(base + ".parquet")
+    if "feather" in formats:
+        # Uncompressed, so readers can memory-map the columns instead of decoding them
+        df.reset_index(drop=True).to_feather(base + ".feather", compression="uncompressed")
+        written.append(base + ".feather")
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write typed Parquet/Feather copies of the dataset CSVs.")
+    parser.add_argument("inputs", nargs="*", help="CSV files (default: data/*.csv and degradation_project/data/*.csv)")
+    parser.add_argument("--format", choices=["parquet", "feather", "both"], default="both",
+                        help="binary format(s) to write")
+    args = parser.parse_args()
+
+    formats = ["parquet", "feather"] if args.format == "both" else [args.format]
+    inputs = args.inputs or sorted(path for pattern in DEFAULT_INPUTS for path in glob.glob(pattern))
+    for csv_path in inputs:
+        start = time.perf_counter()
+        written = convert(csv_path, formats)
+        sizes = ", ".join(f"{os.path.basename(p)} {os.path.getsize(p) / 1024:.0f} KB" for p in written)
+        print(f"💾 {csv_path} ({os.path.getsize(csv_path) / 1024:.0f} KB) -> {sizes} "
+              f"in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Build the degradation prediction grid and check it against the live model.
+
+The grid (src/lookup_grid.py) holds the model's prediction for every cell of
+its split thresholds, so predict.py answers any input with a lookup instead of
+walking the forests. This job rebuilds it from the current flat model, then
+predicts the dataset rows plus random inputs across the app's ranges both
+ways and fails unless every value matches exactly.
+
+Run from the repo root:
+    python degradation_project/build_lookup_grid.py
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Make the repo root importable so shared modules resolve from `src`
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from degradation_project import predict
+from degradation_project.src.model import export_prediction_grid
+from src.schema import DEGRADATION_SCHEMA, read_dataset
+
+DATA_PATH = os.path.join("degradation_project", "data", "degradation_dataset.csv")
+
+
+def sample_inputs(n, geometries, seed=42):
+    """Random inputs across the app's ranges, including an unseen geometry."""
+    rng = np.random.default_rng(seed)
+    ranges = DEGRADATION_SCHEMA["ranges"]
+    days = ranges["Immersion_Time_Days"]
+    return pd.DataFrame({
+        "Scaffold_Geometry": rng.choice(list(geometries) + ["Unseen geometry"], size=n),
+        "Porosity_Percentage": rng.uniform(*ranges["Porosity_Percentage"], size=n),
+        "Immersion_Time_Days": rng.integers(days[0], days[1] + 1, size=n).astype(float),
+        "Mechanical_Loading": rng.integers(0, 2, size=n).astype(float),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and verify the degradation prediction grid.")
+    parser.add_argument("--samples", type=int, default=100_000, help="random inputs to verify the grid on")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    grid = export_prediction_grid(predict.FLAT_MODEL_PATH, predict.GRID_PATH)
+    print(f"🧮 {grid.n_cells:,} cells, {grid.values.nbytes / 1024:.1f} KB, "
+          f"built in {time.perf_counter() - start:.2f}s -> {predict.GRID_PATH}")
+
+    features = list(DEGRADATION_SCHEMA["features"])
+    preprocessor = predict.get_compiled_preprocessor()
+    geometries = predict.get_preprocessor().named_transformers_["cat"].categories_[0]
+    inputs = pd.concat([read_dataset(DATA_PATH, DEGRADATION_SCHEMA)[features],
+                        sample_inputs(args.samples, geometries)], ignore_index=True)
+    X = preprocessor.transform(inputs)
+
+    start = time.perf_counter()
+    looked_up = grid.predict(X)
+    lookup_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    live = predict.get_model().predict(X)
+    live_seconds = time.perf_counter() - start
+    engine = predict.get_engine().predict(X[:10_000])
+
+    mismatched = int(np.sum(np.any(looked_up != live, axis=1)))
+    mismatched += int(np.sum(np.any(looked_up[:10_000] != engine, axis=1)))
+
+    # Rows with a missing value are not in the grid; predict.py hands them to the forest
+    with_missing = inputs.head(1_000).assign(Porosity_Percentage=np.nan)
+    X_missing = preprocessor.transform(with_missing)
+    mismatched += int(np.sum(np.any(predict._predict(X_missing) != predict.get_model().predict(X_missing), axis=1)))
+    print(f"🔍 Verified {len(X):,} inputs (and {len(X_missing):,} with a missing value): grid {len(X) / lookup_seconds:,.0f} rows/s, "
+          f"forest {len(X) / live_seconds:,.0f} rows/s")
+    if mismatched:
+        print(f"❌ {mismatched} predictions differ from the live model")
+        sys.exit(1)
+    print("✅ Grid predictions are identical to the live model")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,7 @@
+import argparse
+import json
 import os
+import sys
 import pandas as pd
 import joblib
 import logging
@@ -11,76 +14,150 @@ from sklearn.multioutput import MultiOutputRegressor
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.metrics import mean_squared_error, r2_score
 
-from src.utils import setup_logging
-
-# --- Set Up Logging ---
-setup_logging()
-logging.info("🛠️ Starting training pipeline...")
-print("🛠️ Starting training pipeline...")
+# Make the repo root importable so shared modules resolve from `src`
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from degradation_project.src.utils import setup_logging
+from degradation_project.src.model import export_flat_model, export_prediction_grid, SEARCH_PARAM_GRID
+from src.schema import DEGRADATION_SCHEMA, binary_copy, read_dataset, to_model_dtypes
 
 # --- Paths ---
 DATA_PATH = os.path.join("degradation_project", "data", "degradation_dataset.csv")
 MODEL_DIR = os.path.join("degradation_project", "models")
-os.makedirs(MODEL_DIR, exist_ok=True)
 
 MODEL_PATH = os.path.join(MODEL_DIR, "degradation_model.pkl")
+FLAT_MODEL_PATH = os.path.join(MODEL_DIR, "degradation_model_flat.pkl")
 PREPROCESSOR_PATH = os.path.join(MODEL_DIR, "preprocessor.pkl")
+SEARCH_RESULTS_PATH = os.path.join(MODEL_DIR, "search_results.json")
+GRID_PATH = os.path.join(MODEL_DIR, "degradation_grid.pkl")
+
+
+def build_preprocessor():
+    """One-hot encodes the geometry and standardizes the numeric columns."""
+    categorical_cols = ["Scaffold_Geometry"]
+    numeric_cols = ["Porosity_Percentage", "Immersion_Time_Days", "Mechanical_Loading"]
+
+    return ColumnTransformer(transformers=[
+        ("cat", OneHotEncoder(handle_unknown="ignore"), categorical_cols),
+        ("num", StandardScaler(), numeric_cols)
+    ])
+
+
+def build_model(fused=False):
+    """
+    One random forest per target, or with fused=True a single forest that
+    predicts all three targets from shared trees.
+    """
+    base_model = RandomForestRegressor(n_estimators=100, random_state=42)
+    if fused:
+        return base_model
+    return MultiOutputRegressor(base_model)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Train the degradation model.")
+    parser.add_argument("--fused", action="store_true",
+                        help="train one multi-output forest instead of one forest per target")
+    parser.add_argument("--search", choices=["grid", "random", "halving"],
+                        help="tune the forests with a cross-validated search before saving them")
+    parser.add_argument("--n-iter", type=int, default=20, help="candidates sampled by --search random")
+    parser.add_argument("--cv", type=int, default=5, help="cross-validation folds for --search")
+    parser.add_argument("--n-jobs", type=int, default=-1, help="parallel jobs for --search (-1 = all cores)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    # --- Set Up Logging ---
+    setup_logging()
+    logging.info("🛠️ Starting training pipeline...")
+    print("🛠️ Starting training pipeline...")
+    os.makedirs(MODEL_DIR, exist_ok=True)
+
+    # --- Load Data ---
+    print("📥 Loading dataset...")
+    df = read_dataset(binary_copy(DATA_PATH), DEGRADATION_SCHEMA)
+
+    # --- Features and Targets ---
+    X = to_model_dtypes(
+        df[["Scaffold_Geometry", "Porosity_Percentage", "Immersion_Time_Days", "Mechanical_Loading"]],
+        DEGRADATION_SCHEMA)
+    y = df[[
+        "Compressive_Stiffness_MPa",
+        "Weight_Loss_Percentage",
+        "Water_Absorption_Percentage"
+    ]]
+
+    # --- Preprocessing ---
+    print("🧹 Setting up preprocessing pipeline...")
+    preprocessor = build_preprocessor()
+
+    # --- Model Pipeline ---
+    print("⚙️  Building model pipeline..." + (" (fused multi-output forest)" if args.fused else ""))
+    multioutput_model = build_model(fused=args.fused)
+
+    # --- Split ---
+    print("🔀 Splitting dataset into train and test...")
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+
+    # --- Train ---
+    if args.search:
+        from src.search import search_forest, print_search_results, search_report
+
+        print(f"🔍 Tuning forest parameters ({args.search} search)...")
+        param_grid = SEARCH_PARAM_GRID
+        if args.fused:
+            # The fused forest is tuned directly rather than through the MultiOutputRegressor wrapper
+            param_grid = {name.replace("estimator__", "", 1): values for name, values in param_grid.items()}
+        search = search_forest(
+            multioutput_model, param_grid, X_train, y_train, preprocessor,
+            method=args.search, cv=args.cv, n_iter=args.n_iter, n_jobs=args.n_jobs,
+        )
+        print_search_results(search)
+        pipeline = Pipeline(steps=[
+            ("preprocessing", search["preprocessor"]),
+            ("regressor", search["best_estimator"])
+        ])
+        logging.info(f"🏆 Best parameters: {search['best_params']} (R² {search['best_score']:.3f})")
+        with open(SEARCH_RESULTS_PATH, "w") as f:
+            json.dump(search_report(search), f, indent=2)
+        logging.info(f"✅ Search results saved to: {SEARCH_RESULTS_PATH}")
+    else:
+        pipeline = Pipeline(steps=[
+            ("preprocessing", preprocessor),
+            ("regressor", multioutput_model)
+        ])
+        print("🏋️ Training the model...")
+        pipeline.fit(X_train, y_train)
+    logging.info("✅ Model training complete.")
+    print("✅ Model training complete.")
+
+    # --- Evaluate ---
+    print("\n📊 Evaluation Metrics:")
+    y_pred = pipeline.predict(X_test)
+    for i, col in enumerate(y.columns):
+        mse = mean_squared_error(y_test.iloc[:, i], y_pred[:, i])
+        r2 = r2_score(y_test.iloc[:, i], y_pred[:, i])
+        print(f"• {col}: MSE = {mse:.3f}, R² = {r2:.3f}")
+        logging.info(f"{col} → MSE: {mse:.3f} | R²: {r2:.3f}")
+
+    # --- Save ---
+    print("\n💾 Saving model and preprocessor...")
+    joblib.dump(pipeline.named_steps["regressor"], MODEL_PATH)
+    joblib.dump(pipeline.named_steps["preprocessing"], PREPROCESSOR_PATH)
+    export_flat_model(pipeline.named_steps["regressor"], FLAT_MODEL_PATH, source_path=MODEL_PATH)
+    logging.info(f"✅ Model saved to: {MODEL_PATH}")
+    logging.info(f"✅ Memory-mappable model saved to: {FLAT_MODEL_PATH}")
+    try:
+        grid = export_prediction_grid(FLAT_MODEL_PATH, GRID_PATH)
+        logging.info(f"✅ Prediction grid ({grid.n_cells:,} cells) saved to: {GRID_PATH}")
+    except ValueError as e:
+        # Predictions fall back to the forest; the old grid no longer matches the model
+        logging.info(f"ℹ️ No prediction grid: {e}")
+        print(f"ℹ️ No prediction grid: {e}")
+    logging.info(f"✅ Preprocessor saved to: {PREPROCESSOR_PATH}")
+    print("✅ All done! Artifacts saved in:", MODEL_DIR)
+
 
-# --- Load Data ---
-print("📥 Loading dataset...")
-df = pd.read_csv(DATA_PATH)
-
-# --- Features and Targets ---
-X = df[["Scaffold_Geometry", "Porosity_Percentage", "Immersion_Time_Days", "Mechanical_Loading"]]
-y = df[[
-    "Compressive_Stiffness_MPa",
-    "Weight_Loss_Percentage",
-    "Water_Absorption_Percentage"
-]]
-
-# --- Preprocessing ---
-print("🧹 Setting up preprocessing pipeline...")
-categorical_cols = ["Scaffold_Geometry"]
-numeric_cols = ["Porosity_Percentage", "Immersion_Time_Days", "Mechanical_Loading"]
-
-preprocessor = ColumnTransformer(transformers=[
-    ("cat", OneHotEncoder(handle_unknown="ignore"), categorical_cols),
-    ("num", StandardScaler(), numeric_cols)
-])
-
-# --- Model Pipeline ---
-print("⚙️  Building model pipeline...")
-base_model = RandomForestRegressor(n_estimators=100, random_state=42)
-multioutput_model = MultiOutputRegressor(base_model)
-
-pipeline = Pipeline(steps=[
-    ("preprocessing", preprocessor),
-    ("regressor", multioutput_model)
-])
-
-# --- Split ---
-print("🔀 Splitting dataset into train and test...")
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-
-# --- Train ---
-print("🏋️ Training the model...")
-pipeline.fit(X_train, y_train)
-logging.info("✅ Model training complete.")
-print("✅ Model training complete.")
-
-# --- Evaluate ---
-print("\n📊 Evaluation Metrics:")
-y_pred = pipeline.predict(X_test)
-for i, col in enumerate(y.columns):
-    mse = mean_squared_error(y_test.iloc[:, i], y_pred[:, i])
-    r2 = r2_score(y_test.iloc[:, i], y_pred[:, i])
-    print(f"• {col}: MSE = {mse:.3f}, R² = {r2:.3f}")
-    logging.info(f"{col} → MSE: {mse:.3f} | R²: {r2:.3f}")
-
-# --- Save ---
-print("\n💾 Saving model and preprocessor...")
-joblib.dump(pipeline.named_steps["regressor"], MODEL_PATH)
-joblib.dump(preprocessor, PREPROCESSOR_PATH)
-logging.info(f"✅ Model saved to: {MODEL_PATH}")
-logging.info(f"✅ Preprocessor saved to: {PREPROCESSOR_PATH}")
-print("✅ All done! Artifacts saved in:", MODEL_DIR)
+if __name__ == "__main__":
+    main()
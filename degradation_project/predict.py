@@ -1,16 +1,134 @@
 # degradation_project/predict.py
 
 import os
-import pandas as pd
+from functools import lru_cache
+
 import joblib
+import numpy as np
+import pandas as pd
+
+from degradation_project.src.model import load_flat_model
+from src.compiled_preprocessor import CompiledPreprocessor
+from src.flat_forest import FlatForest
+from src.lookup_grid import load_lookup_grid
+from src.registry import file_version, load_artifact
+from src.schema import DEGRADATION_SCHEMA, iter_dataset
 
 # Load paths
 MODEL_PATH = os.path.join("degradation_project", "models", "degradation_model.pkl")
+FLAT_MODEL_PATH = os.path.join("degradation_project", "models", "degradation_model_flat.pkl")
 PREPROCESSOR_PATH = os.path.join("degradation_project", "models", "preprocessor.pkl")
+GRID_PATH = os.path.join("degradation_project", "models", "degradation_grid.pkl")
+
+# The flat engine is faster up to about this many rows; sklearn's compiled loop wins above it
+ENGINE_MAX_ROWS = 256
+
+# Default sweep axes: every day of the app's immersion slider, porosity in 0.5 % steps
+SWEEP_DAYS = np.arange(DEGRADATION_SCHEMA["ranges"]["Immersion_Time_Days"][1] + 1, dtype=np.float64)
+SWEEP_POROSITY = np.arange(0.0, DEGRADATION_SCHEMA["ranges"]["Porosity_Percentage"][1] + 0.25, 0.5)
+
+TARGET_COLUMNS = [
+    "Compressive_Stiffness_MPa",
+    "Weight_Loss_Percentage",
+    "Water_Absorption_Percentage"
+]
+
+
+def get_model():
+    """Return the degradation model, loading it on first use."""
+    return load_artifact(MODEL_PATH)
+
+
+def get_engine():
+    """
+    Return the flat-array inference engine, which walks all three target forests in one pass.
+
+    Memory-maps the exported flat model when it was exported from the current
+    pickle, otherwise flattens the pickle. Predictions are identical to get_model().
+    """
+    if _flat_model_is_current():
+        return load_artifact(FLAT_MODEL_PATH, loader=load_flat_model, key="flat")
+    return load_artifact(MODEL_PATH, loader=lambda path: FlatForest.from_estimator(joblib.load(path)), key="flat")
+
+
+def _flat_model_is_current():
+    """Whether the flat export exists and matches the pickle (or there is no pickle to compare with)."""
+    if not os.path.exists(FLAT_MODEL_PATH):
+        return False
+    if not os.path.exists(MODEL_PATH):
+        return True
+    flat = load_artifact(FLAT_MODEL_PATH, loader=load_flat_model, key="flat")
+    return getattr(flat, "source_version", None) == file_version(MODEL_PATH)
+
+
+def engine_source():
+    """The model file get_engine() is built from."""
+    return FLAT_MODEL_PATH if _flat_model_is_current() else MODEL_PATH
+
+
+def get_lookup_grid():
+    """
+    Return the precomputed prediction grid (build_lookup_grid.py), or None.
+
+    The grid is memory-mapped on first use and only returned while it was built
+    from the current model file, so a retrained model is never answered from a stale grid.
+    """
+    if not os.path.exists(GRID_PATH):
+        return None
+    grid = load_artifact(GRID_PATH, loader=load_lookup_grid, key="grid")
+    return grid if grid.source_version == file_version(engine_source()) else None
+
+
+def get_preprocessor():
+    """Return the fitted preprocessor, loading it on first use."""
+    return load_artifact(PREPROCESSOR_PATH)
+
+
+def get_compiled_preprocessor():
+    """Return the fitted preprocessor compiled to NumPy; transforms exactly like get_preprocessor()."""
+    return load_artifact(
+        PREPROCESSOR_PATH,
+        loader=lambda path: CompiledPreprocessor.from_column_transformer(joblib.load(path)),
+        key="compiled",
+    )
+
+
+def warm_up():
+    """Load the inference engine, lookup grid and preprocessor ahead of the first prediction."""
+    get_engine()
+    get_lookup_grid()
+    get_compiled_preprocessor()
+
+
+def _predict(X):
+    """Predict preprocessed rows with whichever backend is faster for this batch size."""
+    grid = get_lookup_grid()
+    if grid is not None:
+        missing = np.isnan(X).any(axis=1)
+        if not missing.any():
+            return grid.predict(X)  # identical to the forest, at any batch size
+        # The grid has no cells for missing values; the forest routes them split by split
+        predictions = np.empty((X.shape[0], grid.values.shape[-1]))
+        predictions[~missing] = grid.predict(X[~missing]).reshape(-1, grid.values.shape[-1])
+        predictions[missing] = _predict_forest(X[missing]).reshape(-1, grid.values.shape[-1])
+        return predictions[:, 0] if grid.squeeze else predictions
+    return _predict_forest(X)
+
+
+def _predict_forest(X):
+    if X.shape[0] <= ENGINE_MAX_ROWS:
+        return get_engine().predict(X)
+    return get_model().predict(X)
+
+
+def __getattr__(name):
+    # Keep `from degradation_project.predict import model, preprocessor` working lazily
+    if name == "model":
+        return get_model()
+    if name == "preprocessor":
+        return get_preprocessor()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Load model and preprocessor once
-model = joblib.load(MODEL_PATH)
-preprocessor = joblib.load(PREPROCESSOR_PATH)
 
 def predict_degradation(input_dict: dict) -> dict:
     """
@@ -29,12 +147,113 @@ def predict_degradation(input_dict: dict) -> dict:
             - 'Weight_Loss_Percentage'
             - 'Water_Absorption_Percentage'
     """
-    df = pd.DataFrame([input_dict])
-    X_processed = preprocessor.transform(df)
-    predictions = model.predict(X_processed)[0]
+    X_processed = get_compiled_preprocessor().transform_one(input_dict)
+    predictions = _predict(X_processed)[0]
 
     return {
         "Compressive_Stiffness_MPa": round(predictions[0], 3),
         "Weight_Loss_Percentage": round(predictions[1], 3),
         "Water_Absorption_Percentage": round(predictions[2], 3)
     }
+
+
+def predict_degradation_batch(inputs, as_frame: bool = True):
+    """
+    Predict degradation metrics for many scaffolds in one transform and predict call.
+
+    Args:
+        inputs (pd.DataFrame or list of dict): One scaffold per row, with the same
+            keys as predict_degradation. Extra columns are ignored.
+        as_frame (bool): Return a DataFrame if True, otherwise a dict of NumPy arrays.
+
+    Returns:
+        pd.DataFrame or dict: One column per target, rounded to 3 decimals like
+        predict_degradation. A DataFrame keeps the index of the input.
+    """
+    df = inputs if isinstance(inputs, pd.DataFrame) else pd.DataFrame(list(inputs))
+    X_processed = get_compiled_preprocessor().transform(df)
+    predictions = np.round(_predict(X_processed), 3)
+
+    columns = {col: predictions[:, i] for i, col in enumerate(TARGET_COLUMNS)}
+    if as_frame:
+        return pd.DataFrame(columns, index=df.index)
+    return columns
+
+
+def iter_predict_degradation_csv(csv_path: str, chunksize: int = 10_000, as_frame: bool = True):
+    """
+    Stream predictions for a file without loading it all into memory.
+
+    Args:
+        csv_path (str): CSV, Parquet or Feather file with the input feature columns.
+        chunksize (int): Number of rows read and predicted per step.
+        as_frame (bool): Passed on to predict_degradation_batch.
+
+    Yields:
+        pd.DataFrame or dict: Predictions for each chunk, in file order. DataFrames
+        are indexed by row number in the file.
+    """
+    for chunk in iter_dataset(csv_path, DEGRADATION_SCHEMA, chunksize):
+        yield predict_degradation_batch(chunk, as_frame=as_frame)
+
+
+def model_version() -> str:
+    """Content hash of the model and preprocessor files that predictions come from."""
+    return ":".join(file_version(path)[:16] for path in (engine_source(), PREPROCESSOR_PATH))
+
+
+@lru_cache(maxsize=64)
+def _sweep(version, geometry, loading, porosity, days):
+    # version is part of the cache key only: a retrained model gets fresh entries
+    porosity_grid, days_grid = np.meshgrid(np.array(porosity), np.array(days), indexing="ij")
+    n = porosity_grid.size
+    columns = {
+        "Scaffold_Geometry": np.full(n, geometry, dtype=object),
+        "Porosity_Percentage": porosity_grid.ravel(),
+        "Immersion_Time_Days": days_grid.ravel(),
+        "Mechanical_Loading": np.full(n, float(loading)),
+    }
+    predictions = np.round(_predict(get_compiled_preprocessor().transform(columns)), 3)
+    result = {col: predictions[:, i].reshape(porosity_grid.shape) for i, col in enumerate(TARGET_COLUMNS)}
+    for values in result.values():
+        values.flags.writeable = False  # shared by every caller of the cache
+    return result
+
+
+def predict_degradation_curve(geometry: str, porosity: float, loading: int, days=None) -> dict:
+    """
+    Predict all three targets over the immersion time in one batched call.
+
+    Args:
+        geometry (str): Scaffold_Geometry
+        porosity (float): Porosity_Percentage
+        loading (int): Mechanical_Loading (0 or 1)
+        days (array-like): Immersion days to predict (default: every day from 0 to 150)
+
+    Returns:
+        dict: 'Immersion_Time_Days' and one read-only array per target, aligned with the days.
+        Results are cached per model version.
+    """
+    days = SWEEP_DAYS if days is None else np.asarray(days, dtype=np.float64)
+    surface = _sweep(model_version(), geometry, loading, (float(porosity),), tuple(days.tolist()))
+    return {"Immersion_Time_Days": days, **{col: values[0] for col, values in surface.items()}}
+
+
+def predict_degradation_surface(geometry: str, loading: int, porosity=None, days=None) -> dict:
+    """
+    Predict all three targets over a porosity x immersion time grid in one batched call.
+
+    Args:
+        geometry (str): Scaffold_Geometry
+        loading (int): Mechanical_Loading (0 or 1)
+        porosity (array-like): Porosity values (default: 0 to 100 % in 0.5 % steps)
+        days (array-like): Immersion days (default: every day from 0 to 150)
+
+    Returns:
+        dict: 'Porosity_Percentage', 'Immersion_Time_Days' and one read-only
+        (n_porosity, n_days) array per target. Results are cached per model version.
+    """
+    porosity = SWEEP_POROSITY if porosity is None else np.asarray(porosity, dtype=np.float64)
+    days = SWEEP_DAYS if days is None else np.asarray(days, dtype=np.float64)
+    surface = _sweep(model_version(), geometry, loading, tuple(porosity.tolist()), tuple(days.tolist()))
+    return {"Porosity_Percentage": porosity, "Immersion_Time_Days": days, **surface}
@@ -1,24 +1,38 @@
 import os
 import joblib
 import pandas as pd
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.multioutput import MultiOutputRegressor
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import OneHotEncoder
-from sklearn.compose import ColumnTransformer
-from sklearn.pipeline import Pipeline
+
+from src.flat_forest import FlatForest
+from src.lookup_grid import LookupGrid, export_lookup_grid
+from src.registry import file_version
+from src.schema import DEGRADATION_SCHEMA, read_dataset, to_model_dtypes
+
+# Forest parameters explored by main.py --search (prefixed for the MultiOutputRegressor wrapper)
+SEARCH_PARAM_GRID = {
+    'estimator__n_estimators': [100, 300],
+    'estimator__max_depth': [None, 8, 16],
+    'estimator__min_samples_leaf': [1, 2, 4],
+    'estimator__max_features': [0.5, 1.0],
+}
 
 
 def load_dataset(csv_path: str) -> pd.DataFrame:
-    """Loads the degradation dataset."""
-    return pd.read_csv(csv_path)
+    """Loads the degradation dataset (CSV, Parquet or Feather) with its schema dtypes."""
+    return read_dataset(csv_path, DEGRADATION_SCHEMA)
 
 
-def build_pipeline() -> Pipeline:
+def build_pipeline() -> "Pipeline":
     """
     Constructs a preprocessing + model pipeline.
     Returns a sklearn Pipeline with a ColumnTransformer and MultiOutputRegressor.
     """
+    # The training-only sklearn modules are imported here, so predict.py can use this module without them
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.multioutput import MultiOutputRegressor
+    from sklearn.preprocessing import OneHotEncoder
+    from sklearn.compose import ColumnTransformer
+    from sklearn.pipeline import Pipeline
+
     categorical_features = ['Scaffold_Geometry']
     numeric_features = ['Porosity_Percentage', 'Immersion_Time_Days', 'Mechanical_Loading']
 
@@ -43,10 +57,14 @@ def train_and_save_model(data_path: str, model_out_path: str, preprocessor_out_p
     """
     Trains the pipeline and saves the model and preprocessor separately.
     """
+    from sklearn.model_selection import train_test_split
+
     df = load_dataset(data_path)
 
     # Features and targets
-    X = df[['Scaffold_Geometry', 'Porosity_Percentage', 'Immersion_Time_Days', 'Mechanical_Loading']]
+    X = to_model_dtypes(
+        df[['Scaffold_Geometry', 'Porosity_Percentage', 'Immersion_Time_Days', 'Mechanical_Loading']],
+        DEGRADATION_SCHEMA)
     y = df[['Compressive_Stiffness_MPa', 'Weight_Loss_Percentage', 'Water_Absorption_Percentage']]
 
     # Split (optional — you can skip if training on full data)
@@ -73,3 +91,33 @@ def load_model_and_preprocessor(model_path: str, preprocessor_path: str):
     model = joblib.load(model_path)
     preprocessor = joblib.load(preprocessor_path)
     return model, preprocessor
+
+
+def export_flat_model(model, path: str, source_path: str = None) -> None:
+    """
+    Saves a fitted forest as flat node arrays that can be memory-mapped.
+    Written uncompressed so every worker maps the same read-only pages.
+    source_path is the saved pickle of `model`; its content hash is stored so predict.py ignores a stale export.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    flat = FlatForest.from_estimator(model)
+    flat.source_version = file_version(source_path) if source_path else None
+    joblib.dump(flat, path, compress=0)
+
+
+def load_flat_model(path: str, mmap_mode="r") -> FlatForest:
+    """
+    Loads a model saved by export_flat_model.
+    With mmap_mode='r' the node arrays stay backed by the file instead of the heap.
+    """
+    return joblib.load(path, mmap_mode=mmap_mode)
+
+
+def export_prediction_grid(flat_model_path: str, grid_path: str) -> LookupGrid:
+    """
+    Tabulates the flat model over its threshold cells and saves the grid next to it.
+    The grid records the flat model's content hash, so predict.py ignores it once the model changes.
+    """
+    grid = LookupGrid.from_forest(load_flat_model(flat_model_path), source_version=file_version(flat_model_path))
+    export_lookup_grid(grid, grid_path)
+    return grid
@@ -2,12 +2,14 @@ import pandas as pd
 from sklearn.compose import ColumnTransformer
 from sklearn.preprocessing import OneHotEncoder
 
+from src.schema import DEGRADATION_SCHEMA, read_dataset
+
 
 def load_degradation_data(csv_path: str) -> pd.DataFrame:
     """
-    Load the degradation dataset from CSV.
+    Load the degradation dataset from CSV, Parquet or Feather with its schema dtypes.
     """
-    return pd.read_csv(csv_path)
+    return read_dataset(csv_path, DEGRADATION_SCHEMA)
 
 
 def get_feature_columns():
@@ -2,17 +2,16 @@ import sys
 import os
 import streamlit as st
 import pandas as pd
-import joblib
-import time
-import base64
 
 # Add src directory to sys.path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from src.predict import predict_printability
+from src import predict as printability
 
 # Add degradation_project/src to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'degradation_project')))
-from degradation_project.predict import predict_degradation
+from degradation_project import predict as degradation
+from frontend.asset_cache import asset_src
+from src.memo import get_memo
 
 # --- Page Config ---
 st.set_page_config(
@@ -21,8 +20,44 @@ st.set_page_config(
     layout="wide"
 )
 
-GIF_PATH = os.path.join(os.path.dirname(__file__), "assets", "Loading.gif")
-GIF_DEGRADATION_PATH = os.path.join(os.path.dirname(__file__), "assets", "loading_degradation.gif")
+GIF_NAME = "Loading.gif"
+GIF_DEGRADATION_NAME = "loading_degradation.gif"
+STATIC_SERVING = st.get_option("server.enableStaticServing")
+
+
+# --- Cached Models and Predictions ---
+@st.cache_resource(show_spinner="Loading printability model...")
+def load_printability_model():
+    """Load the printability model once per server process, shared by all sessions."""
+    printability.warm_up()
+    return printability.get_engine()
+
+
+@st.cache_resource(show_spinner="Loading degradation model...")
+def load_degradation_model():
+    """Load the degradation model once per server process, shared by all sessions."""
+    degradation.warm_up()
+    return degradation.get_engine()
+
+
+def cached_predict_printability(input_data: dict) -> int:
+    """Predict printability, reusing results for inputs that match at widget resolution until the model changes."""
+    return get_memo("printability")(input_data)
+
+
+def cached_predict_degradation(input_data: dict) -> dict:
+    """Predict degradation metrics, reusing results for inputs that match at widget resolution until the model changes."""
+    return get_memo("degradation")(input_data)
+
+
+def show_loading_animation(name, caption):
+    """Flash the loading GIF in the browser; it fades out on its own without blocking the script."""
+    st.markdown(f"""
+        <div class="loading-flash">
+            <img src="{asset_src(name, STATIC_SERVING)}" width="200">
+            <p>{caption}</p>
+        </div>
+    """, unsafe_allow_html=True)
 
 # --- Custom Styling ---
 st.markdown("""
@@ -62,6 +97,14 @@ st.markdown("""
             outline: none;
             box-shadow: none;
         }
+        .loading-flash {
+            overflow: hidden;
+            animation: loading-fade 1.5s ease-in forwards;
+        }
+        @keyframes loading-fade {
+            0%, 60% { opacity: 1; max-height: 260px; }
+            100% { opacity: 0; max-height: 0; }
+        }
         /* Hide deploy button, Streamlit header and footer */
         # header {visibility: hidden;}
     </style>
@@ -87,30 +130,26 @@ It estimates how much a scaffold loses stiffness, gains water, and degrades stru
 """)
     st.sidebar.success("Now fully functional! 🔬")
 
+memo_stats = get_memo("printability" if section == "Printability Prediction" else "degradation").stats()
+st.sidebar.caption(f"Prediction cache: {memo_stats['size']} entries, {memo_stats['hit_rate']:.0%} hit rate")
 st.sidebar.markdown("---")
 
 # --- Title with GIF ---
-# Choose title gif based on section
-if section == "Printability Prediction":
-    title_gif_path = os.path.join(os.path.dirname(__file__), "assets", "title.gif")
-else:
-    title_gif_path = os.path.join(os.path.dirname(__file__), "assets", "Title_degradation.gif")  # You can rename it as needed
-
-# Load and encode selected gif
-with open(title_gif_path, "rb") as f:
-    gif_bytes = f.read()
-    gif_base64 = base64.b64encode(gif_bytes).decode()
+# Choose title gif based on section (a static URL, or a data URI encoded once per process)
+title_gif_name = "title.gif" if section == "Printability Prediction" else "Title_degradation.gif"
+title_gif_src = asset_src(title_gif_name, STATIC_SERVING)
 
 
 col1, col2 = st.columns([2, 17])
 with col1:
-    st.markdown(f"""<img src="data:image/gif;base64,{gif_base64}" width="100">""", unsafe_allow_html=True)
+    st.markdown(f"""<img src="{title_gif_src}" width="100">""", unsafe_allow_html=True)
 with col2:
     title_text = "Bio-Ink Printability Predictor" if section == "Printability Prediction" else "3D Printed Scaffold Degradation Predictor"
     st.markdown(f"<h2 style='margin-top: 0.4em; color: #004d66;'>{title_text}</h2>", unsafe_allow_html=True)
 
 # --- Main Section Logic ---
 if section == "Printability Prediction":
+    load_printability_model()
     st.subheader("Enter Bio-Ink Parameters")
 
     Gelatin_pct = st.number_input("Gelatin (%)", 0.0, 30.0, 1.5, 0.1)
@@ -147,16 +186,12 @@ if section == "Printability Prediction":
         }
 
         try:
-            prediction = predict_printability(input_data)
+            prediction = cached_predict_printability(input_data)
         except Exception as e:
             st.error("❌ Prediction failed. Check input or model.")
             st.stop()
 
-        anim_container = st.empty()
-        with anim_container:
-            st.image(GIF_PATH, caption="🔄 Analyzing formulation...", width=200)
-            time.sleep(5)
-        anim_container.empty()
+        show_loading_animation(GIF_NAME, "🔄 Analyzing formulation...")
 
         st.markdown("### Prediction Result")
 
@@ -236,7 +271,38 @@ if section == "Printability Prediction":
             st.markdown(point)
         st.markdown(f"---\n{final_note}")
 
+    # --- Inverse Design ---
+    with st.expander("🧭 Suggest printable formulations near these settings"):
+        n_suggestions = st.number_input("Number of suggestions", 1, 10, 5, 1)
+        keep_needle = st.checkbox(f"Keep needle size ({Needle})")
+        no_crosslinker = st.checkbox("Without crosslinker")
+
+        if st.button("🔎 Search Formulations"):
+            from src.inverse_design import find_printable_formulations
+
+            start = {
+                'Gelatin_pct': Gelatin_pct, 'Silk_pct': Silk_pct, 'LH': LH, 'PP': PP, 'PS': PS, 'T': T,
+                'TG_min': TG_min, 'Used_crosslinker': 1 if Used_crosslinker == "Yes" else 0,
+                'Needle': Needle, 'Remarks': "Predicted via UI"
+            }
+            fixed = {}
+            if keep_needle:
+                fixed['Needle'] = Needle
+            if no_crosslinker:
+                fixed['Used_crosslinker'] = 0
+
+            with st.spinner("Searching formulations..."):
+                suggestions = find_printable_formulations(start, k=n_suggestions, fixed=fixed)
+            st.dataframe(
+                suggestions.drop(columns=["Remarks"]).style.format(
+                    {"Printable_Probability": "{:.0%}", "Distance": "{:.0%}"}, precision=2),
+                hide_index=True,
+            )
+            st.caption("Probability is the share of trees voting printable. Distance is the mean change "
+                       "from your settings, relative to each input's range.")
+
 elif section == "Degradation Prediction":
+    load_degradation_model()
     st.subheader("Enter Scaffold Degradation Parameters")
 
     Scaffold_Geometry = st.selectbox(
@@ -266,20 +332,14 @@ elif section == "Degradation Prediction":
         }
 
         try:
-            # Show loading animation
-            anim_container = st.empty()
-            with anim_container:
-                st.image(GIF_DEGRADATION_PATH, caption="🔄 Simulating degradation process...", width=200)
-                time.sleep(5)
-            anim_container.empty()
-
-            predictions = predict_degradation(deg_input)
-
+            predictions = cached_predict_degradation(deg_input)
         except Exception as e:
             st.error("❌ Prediction failed. Please check model or input values.")
             st.exception(e)
             st.stop()
 
+        show_loading_animation(GIF_DEGRADATION_NAME, "🔄 Simulating degradation process...")
+
         st.markdown("### Predicted Degradation Outcomes")
         st.write(f"• **Compressive Stiffness (MPa):** `{predictions['Compressive_Stiffness_MPa']:.2f}`")
         st.write(f"• **Weight Loss (%):** `{predictions['Weight_Loss_Percentage']:.2f}`")
@@ -308,6 +368,18 @@ elif section == "Degradation Prediction":
         st.markdown(degradation_level)
         st.markdown(mechanical_comment)
 
+        # --- Trajectory over the whole immersion range, from one batched prediction ---
+        st.markdown("### Degradation Over Time")
+        curve = degradation.predict_degradation_curve(
+            Scaffold_Geometry, Porosity_Percentage, deg_input["Mechanical_Loading"])
+        st.line_chart(
+            pd.DataFrame({
+                "Compressive Stiffness (MPa)": curve["Compressive_Stiffness_MPa"],
+                "Weight Loss (%)": curve["Weight_Loss_Percentage"],
+                "Water Absorption (%)": curve["Water_Absorption_Percentage"],
+            }, index=pd.Index(curve["Immersion_Time_Days"].astype(int), name="Immersion Time (Days)")),
+        )
+
 
 
 
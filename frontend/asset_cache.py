@@ -0,0 +1,45 @@
+import base64
+import functools
+import mimetypes
+import os
+from urllib.parse import quote
+
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
+STATIC_DIR = os.path.join(os.path.dirname(__file__), "static")
+
+
+@functools.lru_cache(maxsize=None)
+def data_uri(path):
+    """
+    Read a file once per process and return it as a base64 data URI.
+
+    Parameters:
+        path (str): File to encode
+
+    Returns:
+        str: data:<mime>;base64,... string
+    """
+    mime = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    with open(path, "rb") as f:
+        return f"data:{mime};base64," + base64.b64encode(f.read()).decode()
+
+
+def asset_src(name, static_serving=False):
+    """
+    Return an <img src> value for a frontend asset.
+
+    With Streamlit static serving enabled and an optimized copy in frontend/static/
+    (see build_assets.py), the browser gets a plain URL it can cache, so reruns send
+    only a short string. Otherwise the original asset is inlined as a data URI that
+    is encoded once per process.
+
+    Parameters:
+        name (str): File name inside frontend/assets/
+        static_serving (bool): Whether server.enableStaticServing is on
+
+    Returns:
+        str: URL or data URI
+    """
+    if static_serving and os.path.exists(os.path.join(STATIC_DIR, name)):
+        return f"app/static/{quote(name)}"
+    return data_uri(os.path.join(ASSETS_DIR, name))
@@ -0,0 +1,85 @@
+"""
+Build size-optimized copies of the frontend GIFs into frontend/static/.
+
+Each GIF is shrunk to the width the app displays it at, re-quantized to a smaller
+palette and saved with Pillow's GIF optimizer. Optionally only every Nth frame is
+kept; frame durations are merged so the animation keeps its speed. If the result
+is not smaller, the original is copied unchanged. The app serves these files by URL
+when static serving is enabled (see .streamlit/config.toml) and falls back to the
+originals in frontend/assets/ otherwise.
+
+Run from the repo root:
+    python frontend/build_assets.py [--frame-step 2]
+"""
+import argparse
+import os
+import shutil
+
+from PIL import Image, ImageSequence
+
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
+STATIC_DIR = os.path.join(os.path.dirname(__file__), "static")
+
+# Asset name -> width in pixels it is displayed at in app.py
+DISPLAY_WIDTHS = {
+    "title.gif": 100,
+    "Title_degradation.gif": 100,
+    "Loading.gif": 200,
+    "loading_degradation.gif": 200,
+}
+
+
+def optimize_gif(src, dst, width, colors=128, frame_step=1):
+    """
+    Write a resized, re-optimized copy of an animated GIF.
+
+    Parameters:
+        src (str): Source GIF path
+        dst (str): Output GIF path
+        width (int): Target width; GIFs are never upscaled
+        colors (int): Palette size per frame
+        frame_step (int): Keep every Nth frame
+
+    Returns:
+        tuple: (source size in bytes, output size in bytes)
+    """
+    with Image.open(src) as im:
+        scale = min(1.0, width / im.width)
+        size = (max(1, round(im.width * scale)), max(1, round(im.height * scale)))
+        loop = im.info.get("loop", 0)
+
+        frames, durations = [], []
+        for i, frame in enumerate(ImageSequence.Iterator(im)):
+            duration = frame.info.get("duration", 100)
+            if i % frame_step:
+                durations[-1] += duration
+                continue
+            frame = frame.convert("RGBA")
+            if frame.size != size:
+                frame = frame.resize(size, Image.LANCZOS)
+            frames.append(frame.quantize(colors))
+            durations.append(duration)
+
+    frames[0].save(dst, save_all=True, append_images=frames[1:], duration=durations,
+                   loop=loop, optimize=True)
+    if os.path.getsize(dst) >= os.path.getsize(src):
+        shutil.copyfile(src, dst)
+    return os.path.getsize(src), os.path.getsize(dst)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--colors", type=int, default=128, help="palette size per frame")
+    parser.add_argument("--frame-step", type=int, default=1, help="keep every Nth animation frame")
+    args = parser.parse_args()
+
+    os.makedirs(STATIC_DIR, exist_ok=True)
+    for name, width in DISPLAY_WIDTHS.items():
+        before, after = optimize_gif(os.path.join(ASSETS_DIR, name), os.path.join(STATIC_DIR, name),
+                                     width, args.colors, args.frame_step)
+        print(f"🖼️ {name}: {before / 1024:.0f} KB → {after / 1024:.0f} KB")
+    print(f"✅ Optimized assets written to {STATIC_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,50 @@
-from src.data_preprocessing import load_data, preprocess_data
-from src.model import train_model, save_model
-from src.evaluate import evaluate_model, plot_confusion_matrix
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+from src.data_preprocessing import load_data, preprocess_data, build_preprocessor, split_data
+from src.model import train_model, save_model, load_model, export_flat_model, SEARCH_PARAM_GRID
+from src.incremental import (count_present, grow_forest, load_manifest, new_row_mask, remap_thresholds,
+                             row_hashes, save_manifest, update_preprocessor)
+from src.cache import ArtifactCache, code_version, content_key
+from src.schema import binary_copy
+from src.evaluate import evaluate_model, plot_confusion_matrix, plot_in_background
 from src.utils import set_seed, ensure_dir
 import joblib
 
+# Rows (by hash) the saved model has been trained on, for --incremental
+MANIFEST_PATH = "outputs/models/training_manifest.npz"
+
+# Memory-mapped train/test matrices written by --out-of-core
+OUT_OF_CORE_DIR = "outputs/out_of_core"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Train the printability model.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only train on rows added since the last run, growing the saved forest")
+    parser.add_argument("--out-of-core", action="store_true",
+                        help="preprocess the CSV in chunks into memory-mapped matrices instead of loading it whole")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="rows per chunk for --out-of-core")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="recompute everything instead of reusing cached preprocessing and models")
+    parser.add_argument("--cache-size-mb", type=int, default=512, help="size limit of outputs/cache/")
+    parser.add_argument("--search", choices=["grid", "random", "halving"],
+                        help="tune the forest with a cross-validated search before saving it")
+    parser.add_argument("--n-iter", type=int, default=20, help="candidates sampled by --search random")
+    parser.add_argument("--cv", type=int, default=5, help="cross-validation folds for --search")
+    parser.add_argument("--n-jobs", type=int, default=-1, help="parallel jobs for --search (-1 = all cores)")
+    parser.add_argument("--plots", action="store_true",
+                        help="save a confusion matrix PNG to outputs/plots/ (drawn while the artifacts are saved)")
+    return parser.parse_args()
+
 
 def main():
+    args = parse_args()
+
     # Step 0: Setup
     set_seed(42)
     ensure_dir("outputs/models")
@@ -15,24 +54,150 @@ def main():
     data_path = "data/dataset-latest.csv"
 
     target_column = "Printable"
-    df = load_data(data_path)
+    if args.out_of_core:
+        # Steps 1-3 without holding the dataset in memory
+        model, preprocessor, X_test, y_test, manifest = train_out_of_core(binary_copy(data_path), target_column, args.chunksize)
+    else:
+        df = load_data(data_path)
 
-    # Step 2: Preprocess (Remarks is included during training internally)
-    X_train, X_test, y_train, y_test, preprocessor = preprocess_data(df, target_column, fit=True)
+        if args.incremental:
+            if os.path.exists(MANIFEST_PATH):
+                train_incremental(df, target_column)
+                return
+            print("ℹ️ No training manifest yet — running a full training first.")
 
-    # Step 3: Train model
-    model = train_model(X_train, y_train)
+        model, preprocessor, X_test, y_test, manifest = train_in_memory(args, df, target_column)
     print("✅ Model training completed.")
 
     # Step 4: Evaluate
     y_pred = model.predict(X_test)
     evaluate_model(y_test, y_pred)
-    plot_confusion_matrix(y_test, y_pred, labels=[0, 1])
+    plots = None
+    if args.plots:
+        plots = plot_in_background(plot_confusion_matrix, y_test, y_pred, labels=[0, 1],
+                                   save_path="outputs/plots/confusion_matrix.png")
 
     # Step 5: Save artifacts
     save_model(model, "outputs/models/printability_model.pkl")
+    export_flat_model(model, "outputs/models/printability_model_flat.pkl",
+                      source_path="outputs/models/printability_model.pkl")
     joblib.dump(preprocessor, "outputs/models/preprocessor.pkl")
+    save_manifest(MANIFEST_PATH, *manifest)
     print("💾 Model and preprocessor saved in 'outputs/models/'")
+    if plots is not None:
+        plots.result()
+
+
+def train_in_memory(args, df, target_column):
+    """Preprocess and train on the loaded dataset, reusing cached artifacts when nothing changed."""
+    # Artifacts are keyed by the data, the preprocessing config and the code that builds them
+    cache = None if args.no_cache else ArtifactCache(max_bytes=args.cache_size_mb * 1024 * 1024)
+    features = build_preprocessor(df.drop(columns=[target_column]))
+    data_key = content_key(df, target_column, features)
+
+    def cached(key, compute, label):
+        return compute() if cache is None else cache.cached(key, compute, label)
+
+    if args.search:
+        # Steps 2-3: Tune on raw training rows (preprocessing is fitted inside each CV fold)
+        from sklearn.ensemble import RandomForestClassifier
+        from src import search as search_module
+        from src.search import search_forest, print_search_results, search_report
+
+        X_train, X_test, y_train, y_test = split_data(df, target_column)
+        train_index, test_index = X_train.index, X_test.index
+        search = cached(
+            content_key("search", data_key, SEARCH_PARAM_GRID, args.search, args.cv, args.n_iter,
+                        code_version(preprocess_data, train_model, search_module)),
+            lambda: search_forest(
+                RandomForestClassifier(random_state=42), SEARCH_PARAM_GRID, X_train, y_train,
+                build_preprocessor(X_train), method=args.search, cv=args.cv, n_iter=args.n_iter, n_jobs=args.n_jobs,
+            ),
+            "search results",
+        )
+        print_search_results(search)
+        model, preprocessor = search["best_estimator"], search["preprocessor"]
+        X_test = preprocessor.transform(X_test)
+
+        with open("outputs/search_results.json", "w") as f:
+            json.dump(search_report(search), f, indent=2)
+        print("💾 Search results saved to 'outputs/search_results.json'")
+        # The preprocessor was fitted on the training rows only
+        fitted_rows = df.loc[train_index]
+    else:
+        # Step 2: Preprocess (Remarks is included during training internally)
+        preprocess_key = content_key("preprocess", data_key, code_version(preprocess_data))
+        X_train, X_test, y_train, y_test, preprocessor = cached(
+            preprocess_key, lambda: preprocess_data(df, target_column, fit=True), "preprocessed data")
+
+        # Step 3: Train model
+        model = cached(content_key("model", preprocess_key, code_version(train_model)),
+                       lambda: train_model(X_train, y_train), "model")
+        # preprocess_data fits on every labelled row, then splits with the same call as split_data
+        raw_train, raw_test, _, _ = split_data(df, target_column)
+        train_index, test_index = raw_train.index, raw_test.index
+        fitted_rows = df.dropna(subset=[target_column])
+
+    # The model only saw the training rows; the test rows stay held out in later incremental runs
+    manifest = (row_hashes(df.loc[train_index]), count_present(fitted_rows, preprocessor),
+                row_hashes(df.loc[test_index]))
+    return model, preprocessor, X_test, y_test, manifest
+
+
+def train_out_of_core(data_path, target_column, chunksize):
+    """Fit the preprocessor in one chunked pass, transform into memory-mapped matrices and train on those."""
+    from src.out_of_core import fit_preprocessor_chunked, split_rows, transform_to_memmap
+
+    print(f"📥 Streaming {data_path} in chunks of {chunksize:,} rows...")
+    fitted = fit_preprocessor_chunked(data_path, target_column, chunksize)
+    preprocessor = fitted["preprocessor"]
+    X_train, X_test, y_train, y_test = transform_to_memmap(
+        data_path, preprocessor, target_column, fitted["n_rows"], OUT_OF_CORE_DIR, chunksize)
+    print(f"🧹 Preprocessed {fitted['n_rows']:,} rows into '{OUT_OF_CORE_DIR}'")
+
+    model = train_model(X_train, y_train)
+    # The preprocessor saw every row, the model only the training split
+    train_rows, test_rows = split_rows(fitted["n_rows"])
+    hashes = fitted["row_hashes"]
+    return model, preprocessor, X_test, y_test, (hashes[train_rows], fitted["imputer_counts"], hashes[test_rows])
+
+
+def train_incremental(df, target_column):
+    """Grow the saved model with rows that are not in the training manifest yet."""
+    start = time.perf_counter()
+    df = df.dropna(subset=[target_column])
+    consumed, imputer_counts, held_out = load_manifest(MANIFEST_PATH)
+    hashes = row_hashes(df)
+    # Held-out test rows are neither trained on nor counted as new
+    kept = new_row_mask(hashes, held_out)
+    df, hashes = df[kept], hashes[kept]
+    is_new = new_row_mask(hashes, consumed)
+    if not is_new.any():
+        print("✅ No new rows since the last training run.")
+        return
+
+    model = load_model("outputs/models/printability_model.pkl")
+    preprocessor = joblib.load("outputs/models/preprocessor.pkl")
+    X, y = df.drop(columns=[target_column]), df[target_column]
+    X_new, y_new = X[is_new], y[is_new]
+    print(f"🆕 {len(X_new)} new rows ({(~is_new).sum()} already trained on)")
+
+    # How the current model does on rows it has never seen, before learning from them
+    evaluate_model(y_new, model.predict(preprocessor.transform(X_new)))
+
+    # Update the scaling statistics, then keep the existing trees' splits equivalent
+    imputer_counts, scaling = update_preprocessor(preprocessor, X_new, imputer_counts)
+    remap_thresholds(model, *scaling)
+    added = grow_forest(model, preprocessor.transform(X[~is_new]), y[~is_new],
+                        preprocessor.transform(X_new), y_new)
+    print(f"🌲 Added {added} trees ({model.n_estimators} in total) in {time.perf_counter() - start:.2f}s")
+
+    save_model(model, "outputs/models/printability_model.pkl")
+    export_flat_model(model, "outputs/models/printability_model_flat.pkl",
+                      source_path="outputs/models/printability_model.pkl")
+    joblib.dump(preprocessor, "outputs/models/preprocessor.pkl")
+    save_manifest(MANIFEST_PATH, np.concatenate([consumed, hashes[is_new]]), imputer_counts, held_out)
+    print("💾 Model, preprocessor and training manifest updated in 'outputs/models/'")
 
 
 if __name__ == "__main__":
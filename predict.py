@@ -1,7 +1,5 @@
 import pandas as pd
 import joblib
-from src.model import predict
-from src.data_preprocessing import preprocess_data
 
 
 # Load model and preprocessor
@@ -0,0 +1,162 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from src.schema import SCHEMAS, iter_dataset
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def detect_model(columns):
+    """
+    Decide which model a file is meant for from its column names.
+
+    Parameters:
+        columns (list of str): Column names of the input file
+
+    Returns:
+        str: "printability" or "degradation"
+    """
+    from src.predict import get_compiled_preprocessor as printability_features
+    from degradation_project.predict import get_compiled_preprocessor as degradation_features
+
+    columns = set(columns)
+    matches = [
+        name for name, get in (("printability", printability_features), ("degradation", degradation_features))
+        if set(get().feature_names_in) <= columns
+    ]
+    if len(matches) != 1:
+        raise ValueError(
+            "Could not tell which model the input is for "
+            f"({'both' if matches else 'neither'} feature set matched the columns)."
+        )
+    return matches[0]
+
+
+def read_columns(path):
+    """Return the column names of a CSV, Parquet or Feather file without reading its rows."""
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(path).schema_arrow.names
+    if path.endswith(".feather"):
+        import pyarrow.ipc as ipc
+        return ipc.open_file(path).schema.names
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+def iter_chunks(path, chunksize, model):
+    """Yield the rows of a CSV, Parquet or Feather file as DataFrames typed by the model's dataset schema."""
+    yield from iter_dataset(path, SCHEMAS[model], chunksize)
+
+
+def score_chunk(model, chunk):
+    """
+    Score one chunk with a single vectorized predict.
+
+    Parameters:
+        model (str): "printability" or "degradation"
+        chunk (pd.DataFrame): Input rows
+
+    Returns:
+        pd.DataFrame: The input rows with prediction columns appended
+    """
+    if model == "printability":
+        from src.predict import predict_printability_batch
+        return chunk.assign(Predicted_Printable=predict_printability_batch(chunk))
+
+    from degradation_project.predict import predict_degradation_batch
+    predictions = predict_degradation_batch(chunk).add_prefix("Predicted_")
+    return pd.concat([chunk, predictions], axis=1)
+
+
+def score_chunks(model, chunks, workers):
+    """Yield scored chunks in input order, optionally using a process pool."""
+    if workers <= 1:
+        for chunk in chunks:
+            yield score_chunk(model, chunk)
+        return
+
+    # Keep a bounded number of chunks in flight so memory stays flat
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = []
+        for chunk in chunks:
+            in_flight.append(pool.submit(score_chunk, model, chunk))
+            if len(in_flight) >= 2 * workers:
+                yield in_flight.pop(0).result()
+        for future in in_flight:
+            yield future.result()
+
+
+class OutputWriter:
+    """Append scored chunks to a CSV or Parquet file."""
+
+    def __init__(self, path):
+        self.path = path
+        self._parquet = None
+        self._first = True
+
+    def write(self, df):
+        if self.path.endswith(".parquet"):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._parquet is None:
+                self._parquet = pq.ParquetWriter(self.path, table.schema)
+            self._parquet.write_table(table)
+        else:
+            df.to_csv(self.path, mode="w" if self._first else "a", header=self._first, index=False)
+        self._first = False
+
+    def close(self):
+        if self._parquet is not None:
+            self._parquet.close()
+
+
+def peak_memory_mb():
+    """Peak resident memory of this process and its finished workers, in MB (None if unknown)."""
+    if resource is None:
+        return None
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return max(own, children) / 1024  # ru_maxrss is in KB on Linux
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Score a CSV, Parquet or Feather file with the printability or degradation model.")
+    parser.add_argument("input", help="input .csv, .parquet or .feather file")
+    parser.add_argument("output", help="output .csv or .parquet file (input columns + predictions)")
+    parser.add_argument("--model", choices=["auto", "printability", "degradation"], default="auto",
+                        help="model to use (default: detect from the columns)")
+    parser.add_argument("--chunksize", type=int, default=50_000, help="rows read and scored per chunk")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (1 = score in this process)")
+    args = parser.parse_args()
+
+    model = detect_model(read_columns(args.input)) if args.model == "auto" else args.model
+    print(f"🔎 Scoring {args.input} with the {model} model")
+
+    start = time.perf_counter()
+    rows = 0
+    writer = OutputWriter(args.output)
+    try:
+        for scored in score_chunks(model, iter_chunks(args.input, args.chunksize, model), args.workers):
+            writer.write(scored)
+            rows += len(scored)
+    finally:
+        writer.close()
+    elapsed = time.perf_counter() - start
+
+    peak = peak_memory_mb()
+    print(f"✅ Scored {rows:,} rows in {elapsed:.2f}s ({rows / elapsed:,.0f} rows/sec)")
+    print(f"📈 Peak memory: {peak:.0f} MB" if peak is not None else "📈 Peak memory: n/a on this platform")
+    print(f"💾 Results written to {os.path.abspath(args.output)}")
+
+
+if __name__ == "__main__":
+    main()
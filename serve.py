@@ -0,0 +1,34 @@
+import argparse
+
+from src.server import create_server, warm_up_models
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local HTTP inference server for both models.")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to bind")
+    parser.add_argument("--port", type=int, default=8000, help="port to bind")
+    parser.add_argument("--max-batch-size", type=int, default=64, help="rows that trigger a batch immediately")
+    parser.add_argument("--max-latency-ms", type=float, default=2.0, help="batching window in milliseconds")
+    parser.add_argument("--no-memo", action="store_true", help="predict every request instead of reusing cached results")
+    parser.add_argument("--memo-size", type=int, default=4096, help="cached predictions kept in memory per model")
+    parser.add_argument("--memo-path", help="SQLite file that keeps cached predictions across restarts")
+    args = parser.parse_args()
+
+    print("📦 Loading models...")
+    warm_up_models()
+
+    server = create_server(args.host, args.port, args.max_batch_size, args.max_latency_ms,
+                           memo=not args.no_memo, memo_size=args.memo_size, memo_path=args.memo_path)
+    host, port = server.server_address[:2]
+    print(f"🚀 Serving on http://{host}:{port} (batch ≤ {args.max_batch_size} rows / {args.max_latency_ms} ms)")
+    print("   POST /predict/printability, POST /predict/degradation, GET /health, GET /metrics")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Shutting down.")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import hashlib
+import inspect
+import os
+import threading
+
+import joblib
+
+DEFAULT_CACHE_DIR = os.path.join("outputs", "cache")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def content_key(*parts):
+    """
+    Hash any picklable values (DataFrames, unfitted estimators, dicts, ...) into a cache key.
+
+    Parameters:
+        *parts: Values that together determine an artifact
+
+    Returns:
+        str: Hex digest
+    """
+    return joblib.hash(parts, hash_name="sha1")
+
+
+def code_version(*objects):
+    """
+    Hash the source files that define the given functions or modules, plus the sklearn version.
+
+    Parameters:
+        *objects: Functions or modules an artifact depends on
+
+    Returns:
+        str: Hex digest that changes whenever one of those files or sklearn changes
+    """
+    import sklearn
+
+    digest = hashlib.sha256(sklearn.__version__.encode())
+    for path in sorted({inspect.getsourcefile(obj) for obj in objects}):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class ArtifactCache:
+    """
+    Content-addressed on-disk cache for fitted preprocessors, matrices and models.
+
+    Each entry is one joblib file named after its key. Reading an entry refreshes
+    its modification time; when the directory grows past `max_bytes`, the entries
+    least recently used are deleted first.
+
+    Parameters:
+        directory (str): Where entries are stored
+        max_bytes (int): Size limit for all entries together
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get(self, key, default=None):
+        """Return the entry stored under key, or default if there is none."""
+        path = self._path(key)
+        try:
+            value = joblib.load(path)
+        except (FileNotFoundError, EOFError):
+            return default
+        os.utime(path)  # mark as recently used
+        return value
+
+    def put(self, key, value):
+        """Store value under key, then evict old entries beyond the size limit."""
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        joblib.dump(value, tmp)
+        os.replace(tmp, path)  # readers never see a half-written entry
+        self.evict()
+
+    def cached(self, key, compute, label="artifact"):
+        """
+        Return the entry under key, computing and storing it on a miss.
+
+        Parameters:
+            key (str): Cache key from content_key
+            compute (callable): Builds the value when it is not cached
+            label (str): Name used in the hit/miss message
+
+        Returns:
+            The cached or freshly computed value
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is not missing:
+            print(f"♻️ Using cached {label} ({key[:12]})")
+            return value
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        with self._lock:
+            entries = []
+            for name in os.listdir(self.directory):
+                if not name.endswith(".pkl"):
+                    continue
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, name in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                os.remove(os.path.join(self.directory, name))
+                total -= size
+
+    def clear(self):
+        """Delete every entry."""
+        with self._lock:
+            for name in os.listdir(self.directory):
+                if name.endswith(".pkl"):
+                    os.remove(os.path.join(self.directory, name))
@@ -0,0 +1,182 @@
+import numpy as np
+import pandas as pd
+
+
+class CompiledPreprocessor:
+    """
+    A fitted ColumnTransformer reduced to plain NumPy operations.
+
+    Supports the blocks used in this project: SimpleImputer (NaN missing values),
+    StandardScaler, OneHotEncoder (no drop, no infrequent categories) and
+    'passthrough', alone or chained in a Pipeline. The fitted statistics are copied
+    out once; transform() then fills a preallocated float64 array column by column
+    and matches `ColumnTransformer.transform` exactly (as a dense array).
+    """
+
+    def __init__(self, blocks, n_features_out, feature_names_in):
+        self.blocks = blocks
+        self.n_features_out = n_features_out
+        self.feature_names_in = feature_names_in
+
+    @classmethod
+    def from_column_transformer(cls, column_transformer):
+        """
+        Extract the fitted parameters of a ColumnTransformer.
+
+        Parameters:
+            column_transformer: Fitted sklearn ColumnTransformer
+
+        Returns:
+            CompiledPreprocessor
+        """
+        names_in = list(column_transformer.feature_names_in_)
+        blocks = []
+        offset = 0
+
+        for name, transformer, columns in column_transformer.transformers_:
+            if (isinstance(transformer, str) and transformer == "drop") or len(columns) == 0:
+                continue
+            columns = [names_in[c] if isinstance(c, (int, np.integer)) else c for c in columns]
+            if isinstance(transformer, str):  # 'passthrough'
+                steps = []
+            elif hasattr(transformer, "steps"):
+                steps = [step for _, step in transformer.steps if not (step is None or isinstance(step, str))]
+            else:
+                steps = [transformer]
+
+            block = _compile_steps(name, columns, steps)
+            block["start"] = offset
+            offset += block["width"]
+            blocks.append(block)
+
+        return cls(blocks, offset, names_in)
+
+    def transform(self, data, out=None):
+        """
+        Transform raw feature columns.
+
+        Parameters:
+            data (pd.DataFrame or dict): Column name -> values. Extra columns are ignored.
+            out (np.ndarray): Optional float64 array of shape (n_samples, n_features_out) to fill
+
+        Returns:
+            np.ndarray: Transformed features, shape (n_samples, n_features_out)
+        """
+        n_samples = len(data[self.blocks[0]["columns"][0]]) if self.blocks else len(data)
+        if out is None:
+            out = np.empty((n_samples, self.n_features_out), dtype=np.float64)
+
+        for block in self.blocks:
+            if block["kind"] == "numeric":
+                _transform_numeric(block, data, out)
+            else:
+                _transform_onehot(block, data, out)
+        return out
+
+    def transform_one(self, record):
+        """
+        Transform a single input dict without building a DataFrame.
+
+        Parameters:
+            record (dict): Feature name -> value
+
+        Returns:
+            np.ndarray: Shape (1, n_features_out)
+        """
+        data = {}
+        for block in self.blocks:
+            for column in block["columns"]:
+                value = np.empty(1, dtype=object)
+                value[0] = record[column]
+                data[column] = value
+        return self.transform(data)
+
+
+def _compile_steps(name, columns, steps):
+    """Turn the fitted steps applied to one group of columns into a block spec."""
+    from sklearn.impute import SimpleImputer
+    from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+    fill = None
+    mean = np.zeros(len(columns))
+    scale = np.ones(len(columns))
+    encoder = None
+
+    for step in steps:
+        if encoder is not None:
+            raise TypeError(f"'{name}': OneHotEncoder must be the last step")
+        if isinstance(step, SimpleImputer):
+            if not (isinstance(step.missing_values, float) and np.isnan(step.missing_values)):
+                raise TypeError(f"'{name}': only NaN missing_values are supported")
+            if step.add_indicator or len(step.statistics_) != len(columns):
+                raise TypeError(f"'{name}': imputer indicators and dropped empty features are not supported")
+            fill = step.statistics_
+        elif isinstance(step, StandardScaler):
+            if step.mean_ is not None:
+                mean = step.mean_
+            if step.scale_ is not None:
+                scale = step.scale_
+        elif isinstance(step, OneHotEncoder):
+            if step.drop_idx_ is not None or getattr(step, "_infrequent_enabled", False):
+                raise TypeError(f"'{name}': OneHotEncoder with drop or infrequent categories is not supported")
+            encoder = step
+        else:
+            raise TypeError(f"'{name}': unsupported step {type(step).__name__}")
+
+    if encoder is None:
+        return {
+            "kind": "numeric",
+            "columns": columns,
+            "fill": None if fill is None else np.asarray(fill, dtype=np.float64),
+            "mean": np.asarray(mean, dtype=np.float64),
+            "scale": np.asarray(scale, dtype=np.float64),
+            "width": len(columns),
+        }
+
+    # Lookup table per column: category -> position within that column's one-hot slice
+    lookups = [pd.Index(categories) for categories in encoder.categories_]
+    widths = [len(categories) for categories in encoder.categories_]
+    return {
+        "kind": "onehot",
+        "columns": columns,
+        "fill": None if fill is None else list(fill),
+        "lookups": lookups,
+        "offsets": np.cumsum([0] + widths[:-1]),
+        "ignore_unknown": encoder.handle_unknown != "error",
+        "width": sum(widths),
+    }
+
+
+def _transform_numeric(block, data, out):
+    start = block["start"]
+    for j, column in enumerate(block["columns"]):
+        target = out[:, start + j]
+        target[:] = np.asarray(data[column])
+        if block["fill"] is not None:
+            missing = np.isnan(target)
+            if missing.any():
+                target[missing] = block["fill"][j]
+        # Same operations, in the same order, as StandardScaler.transform
+        target -= block["mean"][j]
+        target /= block["scale"][j]
+
+
+def _transform_onehot(block, data, out):
+    start = block["start"]
+    out[:, start:start + block["width"]] = 0.0
+    rows = np.arange(out.shape[0])
+
+    for j, column in enumerate(block["columns"]):
+        values = np.asarray(data[column], dtype=object)
+        if block["fill"] is not None:
+            missing = values != values  # NaN is the only value not equal to itself
+            if missing.any():
+                values = values.copy()
+                values[missing] = block["fill"][j]
+
+        codes = block["lookups"][j].get_indexer(values)
+        known = codes >= 0
+        if not known.all() and not block["ignore_unknown"]:
+            unknown = pd.unique(values[~known])
+            raise ValueError(f"Found unknown categories {list(unknown)} in column {column} during transform")
+        out[rows[known], start + block["offsets"][j] + codes[known]] = 1.0
@@ -0,0 +1,126 @@
+import time
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone, is_classifier
+from sklearn.metrics import accuracy_score, f1_score, mean_squared_error, r2_score, roc_auc_score
+from sklearn.model_selection import RepeatedKFold, RepeatedStratifiedKFold
+
+
+def cross_validate_model(estimator, X, y, preprocessor, n_splits=5, n_repeats=3, refit_preprocessor=True,
+                         n_bootstrap=1000, n_jobs=-1, random_state=42):
+    """
+    Repeated k-fold evaluation of an estimator, with the folds fitted in parallel.
+
+    By default a clone of the preprocessor is fitted on each training fold, so
+    no statistic of a test fold reaches the model. With refit_preprocessor=False
+    the given preprocessor must already be fitted (e.g. the one saved next to the
+    model) and all rows are transformed once up front, so each fold only refits
+    the estimator. That is faster but leaks: a preprocessor fitted on every row
+    has imputed missing values with means that include the test folds. Only
+    without missing values does it give the same trees (scaling is monotone and
+    the one-hot vocabulary is fixed).
+
+    Parameters:
+        estimator: Unfitted classifier or regressor (clone(saved_model) keeps its settings)
+        X (pd.DataFrame): Raw features
+        y (pd.Series or pd.DataFrame): Target(s); a DataFrame gives per-target regression metrics
+        preprocessor: Transformer to clone per fold, or a fitted one with refit_preprocessor=False
+        n_splits (int), n_repeats (int): Folds per repetition and number of repetitions
+        refit_preprocessor (bool): Fit a clone of the preprocessor on each training fold
+        n_bootstrap (int): Resamples of the fold scores for the 95% confidence intervals
+        n_jobs (int): Parallel fold fits (-1 = all cores)
+        random_state (int): Seed for the splits and the bootstrap
+
+    Returns:
+        dict: metrics (name -> mean, std, ci_low, ci_high), folds (one dict of scores per fold)
+              and run details (n_rows, n_splits, n_repeats, seconds)
+    """
+    start = time.perf_counter()
+    classifier = is_classifier(estimator)
+    splitter = (RepeatedStratifiedKFold if classifier else RepeatedKFold)(
+        n_splits=n_splits, n_repeats=n_repeats, random_state=random_state)
+    y_values = np.asarray(y)
+    targets = list(y.columns) if isinstance(y, pd.DataFrame) else [y.name]
+    if not refit_preprocessor:
+        X = preprocessor.transform(X)
+
+    base = clone(estimator)
+    base.set_params(**{name: 1 for name in base.get_params() if name == "n_jobs" or name.endswith("__n_jobs")})
+    folds = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_and_score)(base, X, y_values, train, test, preprocessor if refit_preprocessor else None,
+                                classifier, targets)
+        for train, test in splitter.split(X, y_values if classifier else None)
+    )
+    folds = [{"repeat": i // n_splits, "fold": i % n_splits, **fold} for i, fold in enumerate(folds)]
+
+    scores = pd.DataFrame(folds).drop(columns=["repeat", "fold", "seconds"])
+    rng = np.random.default_rng(random_state)
+    resamples = rng.integers(0, len(scores), size=(n_bootstrap, len(scores)))
+    metrics = {}
+    for name in scores.columns:
+        values = scores[name].to_numpy()
+        means = values[resamples].mean(axis=1)
+        metrics[name] = {
+            "mean": float(values.mean()),
+            "std": float(values.std()),
+            "ci_low": float(np.percentile(means, 2.5)),
+            "ci_high": float(np.percentile(means, 97.5)),
+        }
+
+    return {
+        "estimator": type(estimator).__name__,
+        "n_rows": int(len(y_values)),
+        "n_splits": n_splits,
+        "n_repeats": n_repeats,
+        "refit_preprocessor": refit_preprocessor,
+        "seconds": time.perf_counter() - start,
+        "metrics": metrics,
+        "folds": folds,
+    }
+
+
+def _fit_and_score(estimator, X, y, train, test, preprocessor, classifier, targets):
+    start = time.perf_counter()
+    X_train, X_test = _take(X, train), _take(X, test)
+    if preprocessor is not None:
+        preprocessor = clone(preprocessor)
+        X_train = preprocessor.fit_transform(X_train)
+        X_test = preprocessor.transform(X_test)
+    model = clone(estimator).fit(X_train, y[train])
+    y_test = y[test]
+
+    if classifier:
+        y_pred = model.predict(X_test)
+        binary = len(model.classes_) == 2
+        scores = {
+            "accuracy": accuracy_score(y_test, y_pred),
+            "f1": f1_score(y_test, y_pred, average="binary" if binary else "macro", zero_division=0),
+        }
+        if binary and len(np.unique(y_test)) == 2:
+            scores["roc_auc"] = roc_auc_score(y_test, model.predict_proba(X_test)[:, 1])
+        else:
+            scores["roc_auc"] = float("nan")  # undefined when the fold holds a single class
+    else:
+        y_pred = model.predict(X_test).reshape(len(test), -1)
+        y_test = y_test.reshape(len(test), -1)
+        scores = {}
+        for i, target in enumerate(targets):
+            scores[f"mse_{target}"] = mean_squared_error(y_test[:, i], y_pred[:, i])
+            scores[f"r2_{target}"] = r2_score(y_test[:, i], y_pred[:, i])
+    scores = {name: float(value) for name, value in scores.items()}
+    scores["seconds"] = time.perf_counter() - start
+    return scores
+
+
+def _take(X, rows):
+    return X.iloc[rows] if hasattr(X, "iloc") else X[rows]
+
+
+def print_cv_results(name, result):
+    """Print the mean and 95% confidence interval of every metric."""
+    print(f"\n📊 {name}: {result['n_repeats']}× {result['n_splits']}-fold CV on {result['n_rows']} rows "
+          f"in {result['seconds']:.1f}s")
+    for metric, summary in result["metrics"].items():
+        print(f"   {metric:<40}{summary['mean']:>9.4f}  95% CI [{summary['ci_low']:.4f}, {summary['ci_high']:.4f}]")
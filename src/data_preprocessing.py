@@ -1,14 +1,67 @@
 import pandas as pd
-from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler, OneHotEncoder
 from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import Pipeline
 from sklearn.impute import SimpleImputer
 
+from src.schema import (PRINTABILITY_SCHEMA, binary_copy, feature_roles, read_dataset, schema_for, select_features,
+                        to_model_dtypes)
 
-def load_data(path):
-    """Loads the dataset from a CSV file."""
-    return pd.read_csv(path)
+
+def load_data(path, schema=PRINTABILITY_SCHEMA):
+    """
+    Loads the dataset with the schema's dtypes (float64 numerics, categorical text).
+
+    An up-to-date Parquet/Feather copy written by convert_data.py is read instead of the CSV.
+    """
+    return read_dataset(binary_copy(path), schema)
+
+def build_preprocessor(X, schema=None):
+    """
+    Build the (unfitted) imputation, scaling and encoding transformer for X.
+
+    Parameters:
+        X (pd.DataFrame): Raw feature columns
+        schema (dict): Dataset schema that decides numeric vs categorical;
+                       by default the one that declares X's columns
+
+    Returns:
+        ColumnTransformer
+    """
+    numeric_features, categorical_features = feature_roles(schema or schema_for(X.columns), X.columns)
+
+    numeric_transformer = Pipeline([
+        ('imputer', SimpleImputer(strategy='mean')),
+        ('scaler', StandardScaler())
+    ])
+
+    categorical_transformer = Pipeline([
+        ('imputer', SimpleImputer(strategy='most_frequent')),
+        ('encoder', OneHotEncoder(handle_unknown='ignore'))
+    ])
+
+    return ColumnTransformer([
+        ('num', numeric_transformer, numeric_features),
+        ('cat', categorical_transformer, categorical_features)
+    ])
+
+def split_data(df, target_column):
+    """
+    Split raw rows into train and test sets without transforming them.
+
+    Uses the same rows as preprocess_data(fit=True), so models trained either way
+    are evaluated on the same test set.
+
+    Returns:
+        X_train, X_test, y_train, y_test (raw DataFrames / Series)
+    """
+    from sklearn.model_selection import train_test_split
+
+    schema = schema_for(df.columns)
+    df = to_model_dtypes(df.dropna(subset=[target_column]), schema)
+    X = select_features(df, schema)
+    y = df[target_column]
+    return train_test_split(X, y, test_size=0.2, random_state=42)
 
 def preprocess_data(df, target_column, fit=True, preprocessor=None):
     """
@@ -26,38 +79,25 @@ def preprocess_data(df, target_column, fit=True, preprocessor=None):
     """
     
     # Only drop rows with missing target during training
+    # Features are converted to the float64/object types used at prediction time
+    # Columns the schema does not declare (IDs, notes, ...) are left out
+    schema = schema_for(df.columns)
     if fit:
-        df = df.dropna(subset=[target_column])
-        X = df.drop(columns=[target_column])
+        df = to_model_dtypes(df.dropna(subset=[target_column]), schema)
+        X = select_features(df, schema)
         y = df[target_column]
     else:
-        X = df.copy()
+        X = select_features(to_model_dtypes(df, schema), schema)
         y = None
 
     # Remove 'Remarks' only during prediction
     if not fit and 'Remarks' in X.columns:
         X = X.drop(columns=['Remarks'])
 
-    # Detect column types
-    numeric_features = X.select_dtypes(include=['int64', 'float64']).columns.tolist()
-    categorical_features = X.select_dtypes(include=['object', 'bool']).columns.tolist()
-
     if fit:
-        numeric_transformer = Pipeline([
-            ('imputer', SimpleImputer(strategy='mean')),
-            ('scaler', StandardScaler())
-        ])
-
-        categorical_transformer = Pipeline([
-            ('imputer', SimpleImputer(strategy='most_frequent')),
-            ('encoder', OneHotEncoder(handle_unknown='ignore'))
-        ])
-
-        preprocessor = ColumnTransformer([
-            ('num', numeric_transformer, numeric_features),
-            ('cat', categorical_transformer, categorical_features)
-        ])
+        from sklearn.model_selection import train_test_split
 
+        preprocessor = build_preprocessor(X)
         X_processed = preprocessor.fit_transform(X)
 
         X_train, X_test, y_train, y_test = train_test_split(
@@ -1,6 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
-import seaborn as sns
-import matplotlib.pyplot as plt
 import numpy as np
 
 def evaluate_model(y_true, y_pred):
@@ -26,8 +26,14 @@ def plot_confusion_matrix(y_true, y_pred, labels=None, title="Confusion Matrix",
     - y_pred: Predicted labels
     - labels: Optional list of class labels (e.g., [0, 1])
     - title: Title of the plot
-    - save_path: If provided, saves the plot instead of showing
+    - save_path: If provided, saves the plot as a PNG instead of showing it
+
+    Saving draws on a standalone Agg figure without pyplot, so it needs no
+    display and is safe to run in a background thread. matplotlib and seaborn
+    are only imported here, keeping them out of runs that make no plots.
     """
+    import seaborn as sns
+
     # Compute confusion matrix
     cm = confusion_matrix(y_true, y_pred, labels=labels)
 
@@ -36,17 +42,40 @@ def plot_confusion_matrix(y_true, y_pred, labels=None, title="Confusion Matrix",
         labels = np.unique(np.concatenate([y_true, y_pred]))
 
     # Plotting
-    plt.figure(figsize=(6, 4))
+    if save_path:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(6, 4))
+        FigureCanvasAgg(fig)
+    else:
+        import matplotlib.pyplot as plt
+
+        fig = plt.figure(figsize=(6, 4))
+    ax = fig.add_subplot()
     sns.heatmap(cm, annot=True, fmt='d', cmap='Blues',
-                xticklabels=labels, yticklabels=labels)
-    plt.title(title)
-    plt.xlabel("Predicted Label")
-    plt.ylabel("True Label")
-    plt.tight_layout()
+                xticklabels=labels, yticklabels=labels, ax=ax)
+    ax.set_title(title)
+    ax.set_xlabel("Predicted Label")
+    ax.set_ylabel("True Label")
+    fig.tight_layout()
 
     # Save or show plot
     if save_path:
-        plt.savefig(save_path)
+        fig.savefig(save_path, format="png")
         print(f"📊 Confusion matrix saved to: {save_path}")
     else:
         plt.show()
+
+
+def plot_in_background(plot, *args, **kwargs):
+    """
+    Run a plotting function (with save_path set) in a worker thread.
+
+    Returns:
+        concurrent.futures.Future: Call .result() to wait for the file and re-raise plotting errors
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="plots")
+    future = executor.submit(plot, *args, **kwargs)
+    executor.shutdown(wait=False)  # the thread exits once the plot is written
+    return future
@@ -0,0 +1,196 @@
+import numpy as np
+
+
+class FlatForest:
+    """
+    Tree ensemble stored as flat NumPy node arrays.
+
+    Supports a fitted RandomForestClassifier, RandomForestRegressor, or a
+    MultiOutputRegressor wrapping forests. Every tree is concatenated into the
+    same node arrays, and trees are grouped by the forest they came from so each
+    group produces its own block of output columns. Prediction walks all trees of
+    all groups for the whole batch in one vectorized pass, then sums leaf values
+    per group in fitted tree order, so results are bit-for-bit those of sklearn.
+
+    The object only holds plain arrays, so `joblib.dump(..., compress=0)` followed
+    by `joblib.load(..., mmap_mode='r')` maps the node arrays straight from the file
+    as read-only pages shared by every process that loads it.
+
+    source_version is the content hash (registry.file_version) of the pickle the
+    forest was exported from, so a stale export can be detected; None when unknown.
+    """
+
+    def __init__(self, feature, threshold, children, missing_left, value,
+                 roots, group_sizes, kind, classes=None, n_features_in=None,
+                 squeeze=False, source_version=None):
+        self.feature = feature
+        self.threshold = threshold
+        self.children = children
+        self.missing_left = missing_left
+        self.has_missing = bool(np.any(missing_left))
+        self.value = value
+        self.roots = roots
+        self.group_sizes = group_sizes
+        self.kind = kind
+        self.classes = classes
+        self.n_features_in = n_features_in
+        self.squeeze = squeeze
+        self.source_version = source_version
+
+    @classmethod
+    def from_estimator(cls, model):
+        """
+        Flatten a fitted sklearn forest.
+
+        Parameters:
+            model: RandomForestClassifier, RandomForestRegressor or
+                MultiOutputRegressor of RandomForestRegressor
+
+        Returns:
+            FlatForest
+        """
+        if hasattr(model, "estimators_") and hasattr(model.estimators_[0], "estimators_"):
+            forests = list(model.estimators_)  # MultiOutputRegressor
+        elif hasattr(model, "estimators_"):
+            forests = [model]
+        else:
+            raise TypeError(f"Unsupported model type: {type(model).__name__}")
+
+        kind = "classifier" if hasattr(forests[0], "classes_") else "regressor"
+        if kind == "classifier" and (len(forests) > 1 or forests[0].n_outputs_ != 1):
+            raise TypeError("Only single-output classifiers are supported")
+        if len(forests) > 1 and any(forest.n_outputs_ != 1 for forest in forests):
+            raise TypeError("MultiOutputRegressor must wrap single-output forests")
+
+        n_columns = [forest.estimators_[0].tree_.value.shape[1] if kind == "regressor"
+                     else forest.n_classes_ for forest in forests]
+        width = max(n_columns)
+
+        features, thresholds, lefts, rights, missing, values, roots = [], [], [], [], [], [], []
+        offset = 0
+        for forest in forests:
+            for estimator in forest.estimators_:
+                tree = estimator.tree_
+                n_nodes = tree.node_count
+                index = np.arange(offset, offset + n_nodes)
+                is_leaf = tree.children_left == -1
+
+                features.append(np.where(is_leaf, 0, tree.feature))
+                thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+                lefts.append(np.where(is_leaf, index, tree.children_left + offset))
+                rights.append(np.where(is_leaf, index, tree.children_right + offset))
+                missing.append(tree.missing_go_to_left.astype(bool))
+
+                # Regressors: value is (n_nodes, n_outputs, 1); classifiers: (n_nodes, 1, n_classes)
+                value = tree.value[:, :, 0] if kind == "regressor" else tree.value[:, 0, :]
+                padded = np.zeros((n_nodes, width), dtype=np.float64)
+                padded[:, :value.shape[1]] = value
+                values.append(padded)
+
+                roots.append(offset)
+                offset += n_nodes
+
+        # children[node, 0] is the left child, children[node, 1] the right one
+        children = np.column_stack([np.concatenate(lefts), np.concatenate(rights)])
+
+        return cls(
+            feature=np.concatenate(features).astype(np.intp),
+            threshold=np.concatenate(thresholds).astype(np.float64),
+            children=np.ascontiguousarray(children, dtype=np.intp),
+            missing_left=np.concatenate(missing),
+            value=np.concatenate(values),
+            roots=np.asarray(roots, dtype=np.intp),
+            group_sizes=np.asarray([len(f.estimators_) for f in forests], dtype=np.int64),
+            kind=kind,
+            classes=forests[0].classes_ if kind == "classifier" else None,
+            n_features_in=forests[0].n_features_in_,
+            squeeze=(kind == "regressor" and len(forests) == 1 and n_columns[0] == 1),
+        )
+
+    def apply(self, X):
+        """
+        Return the leaf reached by every row in every tree.
+
+        All (row, tree) pairs start at their tree root and advance one level per
+        step; pairs that reached a leaf drop out of the active set.
+
+        Parameters:
+            X (array-like): Preprocessed features, shape (n_samples, n_features)
+
+        Returns:
+            np.ndarray: Global leaf indices, shape (n_trees, n_samples)
+        """
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        n_samples, n_features = X.shape
+        n_trees = len(self.roots)
+        flat_X = X.ravel()
+        children = self.children.ravel()
+
+        node = np.repeat(self.roots, n_samples)
+        row_offset = np.tile(np.arange(n_samples, dtype=np.intp) * n_features, n_trees)
+        active = np.arange(node.size)
+        current = node
+
+        while active.size:
+            x = flat_X[row_offset + self.feature[current]]
+            # Same test as sklearn: x <= threshold goes left, NaN follows missing_go_to_left
+            go_right = ~(x <= self.threshold[current])
+            if self.has_missing:
+                go_right &= ~(np.isnan(x) & self.missing_left[current])
+            nxt = children[2 * current + go_right]
+            moving = nxt != current
+            node[active] = nxt
+
+            active = active[moving]
+            current = nxt[moving]
+            row_offset = row_offset[moving]
+
+        return node.reshape(n_trees, n_samples)
+
+    def _group_outputs(self, X):
+        """Average the tree values of each group, accumulating trees in fitted order."""
+        leaf_values = self.value[self.apply(X)]  # (n_trees, n_samples, width)
+        outputs = []
+        start = 0
+        for size in self.group_sizes:
+            # accumulate adds strictly tree by tree like sklearn; reduce may sum pairwise
+            total = np.add.accumulate(leaf_values[start:start + size], axis=0)[-1]
+            total /= size
+            outputs.append(total)
+            start += size
+        return outputs
+
+    def predict_proba(self, X):
+        """
+        Class probabilities, matching RandomForestClassifier.predict_proba.
+
+        Parameters:
+            X (array-like): Preprocessed features, shape (n_samples, n_features)
+
+        Returns:
+            np.ndarray: Shape (n_samples, n_classes)
+        """
+        if self.kind != "classifier":
+            raise TypeError("predict_proba is only available for classifiers")
+        return self._group_outputs(X)[0][:, :len(self.classes)]
+
+    def predict(self, X):
+        """
+        Predict labels or regression targets, matching the source estimator.
+
+        Parameters:
+            X (array-like): Preprocessed features, shape (n_samples, n_features)
+
+        Returns:
+            np.ndarray: Labels (classifier) or targets (regressor)
+        """
+        if self.kind == "classifier":
+            return self.classes.take(np.argmax(self.predict_proba(X), axis=1), axis=0)
+
+        outputs = self._group_outputs(X)
+        if self.squeeze:
+            return outputs[0][:, 0]
+        if len(outputs) == 1:
+            return outputs[0]
+        # MultiOutputRegressor: one single-output forest per target column
+        return np.column_stack([out[:, 0] for out in outputs])
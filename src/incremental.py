@@ -0,0 +1,186 @@
+import math
+import os
+
+import numpy as np
+import pandas as pd
+from sklearn.impute import SimpleImputer
+from sklearn.preprocessing import StandardScaler
+
+
+def row_hashes(df):
+    """
+    Hash every row of a DataFrame (values only, index ignored).
+
+    Numeric columns are hashed as float64, so a row hashes the same whether it was
+    read as part of a chunk or of the whole file (where a missing value elsewhere
+    turns an integer column into floats).
+
+    Parameters:
+        df (pd.DataFrame): Rows to hash
+
+    Returns:
+        np.ndarray: One uint64 hash per row
+    """
+    numeric = df.select_dtypes(include="number").columns
+    return pd.util.hash_pandas_object(df.astype(dict.fromkeys(numeric, "float64")), index=False).to_numpy()
+
+
+def new_row_mask(hashes, consumed):
+    """
+    Flag rows that are not in the manifest yet.
+
+    Duplicate rows are counted: if a row occurs three times in the data and twice
+    in the manifest, its third occurrence is new.
+
+    Parameters:
+        hashes (np.ndarray): Row hashes of the current dataset
+        consumed (np.ndarray): Row hashes recorded in the manifest
+
+    Returns:
+        np.ndarray: Boolean mask, True for rows not trained on yet
+    """
+    seen, counts = np.unique(consumed, return_counts=True)
+    occurrence = pd.Series(hashes).groupby(hashes).cumcount().to_numpy()
+    position = np.searchsorted(seen, hashes)
+    known = (position < len(seen)) & (seen[np.minimum(position, len(seen) - 1)] == hashes)
+    already = np.where(known, counts[np.minimum(position, len(seen) - 1)], 0)
+    return occurrence >= already
+
+
+def count_present(X, preprocessor):
+    """Non-missing values per numeric column, the weights of the mean imputer's statistics."""
+    return X[_numeric_columns(preprocessor)].notna().sum().to_numpy()
+
+
+def save_manifest(path, hashes, imputer_counts, held_out=None):
+    """
+    Record the rows a trained model has consumed.
+
+    Parameters:
+        path (str): Manifest file (.npz)
+        hashes (np.ndarray): row_hashes of every row the model was trained on, target included
+        imputer_counts (np.ndarray): count_present of the rows the preprocessor was fitted on
+        held_out (np.ndarray): row_hashes of the test rows, which incremental runs never train on
+    """
+    held_out = np.empty(0, dtype=np.uint64) if held_out is None else held_out
+    np.savez(path, row_hashes=hashes, imputer_counts=imputer_counts, held_out=held_out)
+
+
+def load_manifest(path):
+    """
+    Return (row_hashes, imputer_counts, held_out) from a manifest, or None if it does not exist.
+
+    Manifests written before test rows were recorded have no held_out rows.
+    """
+    if not os.path.exists(path):
+        return None
+    with np.load(path) as manifest:
+        held_out = manifest["held_out"] if "held_out" in manifest.files else np.empty(0, dtype=np.uint64)
+        return manifest["row_hashes"], manifest["imputer_counts"], held_out
+
+
+def update_preprocessor(preprocessor, X_new, imputer_counts):
+    """
+    Fold new rows into the numeric statistics of a fitted ColumnTransformer.
+
+    The mean imputer and StandardScaler statistics are updated as if they had been
+    fitted on old and new rows together. The one-hot vocabulary is kept: new
+    categories are encoded as all zeros, since adding columns would change the
+    feature layout the existing trees were grown on.
+
+    Parameters:
+        preprocessor: Fitted ColumnTransformer with a 'num' imputer/scaler pipeline
+        X_new (pd.DataFrame): New feature rows
+        imputer_counts (np.ndarray): Non-missing values seen so far per numeric column
+
+    Returns:
+        tuple: The updated imputer_counts, and (old_mean, old_scale, new_mean, new_scale)
+        of the scaler for remap_thresholds
+    """
+    numeric = preprocessor.named_transformers_["num"]
+    imputer = next(s for _, s in numeric.steps if isinstance(s, SimpleImputer))
+    scaler = next(s for _, s in numeric.steps if isinstance(s, StandardScaler))
+    columns = X_new[_numeric_columns(preprocessor)]
+    values = columns.to_numpy(dtype=np.float64)
+
+    # Running mean of the non-missing values, which is what the mean imputer fills with
+    present = ~np.isnan(values)
+    new_counts = imputer_counts + present.sum(axis=0)
+    sums = imputer.statistics_ * imputer_counts + np.where(present, values, 0.0).sum(axis=0)
+    imputer.statistics_ = np.divide(sums, new_counts, out=imputer.statistics_.copy(), where=new_counts > 0)
+
+    old_mean, old_scale = scaler.mean_.copy(), scaler.scale_.copy()
+    scaler.partial_fit(imputer.transform(columns))
+    return new_counts, (old_mean, old_scale, scaler.mean_.copy(), scaler.scale_.copy())
+
+
+def remap_thresholds(forest, old_mean, old_scale, new_mean, new_scale):
+    """
+    Rewrite the split thresholds on scaled numeric features for a new scaler.
+
+    Scaling is monotone, so mapping each threshold through the old scaler's
+    inverse and the new scaler keeps every existing tree's decisions unchanged.
+    Assumes the scaled numeric columns come first in the feature layout.
+
+    Parameters:
+        forest: Fitted RandomForest (its trees are modified in place)
+        old_mean, old_scale, new_mean, new_scale (np.ndarray): Scaler parameters per numeric column
+    """
+    for estimator in forest.estimators_:
+        tree = estimator.tree_
+        threshold = tree.threshold  # a writable view of the tree's nodes
+        feature = tree.feature
+        on_numeric = (tree.children_left != -1) & (feature < len(old_mean))
+        columns = feature[on_numeric]
+        raw = threshold[on_numeric] * old_scale[columns] + old_mean[columns]
+        remapped = (raw - new_mean[columns]) / new_scale[columns]
+        # A threshold can equal a training value, and trees compare float32 features:
+        # round up one float32 step so a value that went left before still does
+        threshold[on_numeric] = np.nextafter(remapped.astype(np.float32), np.float32(np.inf))
+
+
+def grow_forest(forest, X_old, y_old, X_new, y_new, n_new_trees=None, replay=4, random_state=42):
+    """
+    Add trees fitted on the new rows plus a replay sample of old rows.
+
+    Parameters:
+        forest: Fitted RandomForest (grown in place through warm_start)
+        X_old, y_old: Preprocessed rows the forest has already been trained on
+        X_new, y_new: Preprocessed new rows
+        n_new_trees (int): Trees to add; by default proportional to the share of new rows (at least 10)
+        replay (int): Old rows sampled per new row, so new trees also see older conditions
+        random_state (int): Seed for the replay sample
+
+    Returns:
+        int: Number of trees added
+    """
+    n_old, n_new = len(y_old), len(y_new)
+    if n_new_trees is None:
+        n_new_trees = max(10, math.ceil(forest.n_estimators * n_new / max(n_old, 1)))
+
+    rng = np.random.RandomState(random_state)
+    sample = rng.choice(n_old, size=min(n_old, replay * n_new), replace=False)
+    y_old = np.asarray(y_old)
+    if hasattr(forest, "classes_"):
+        # Every class must appear, or warm_start refits classes_ and breaks the old trees
+        missing = np.setdiff1d(forest.classes_, np.concatenate([y_old[sample], np.asarray(y_new)]))
+        sample = np.concatenate([sample, [np.flatnonzero(y_old == c)[0] for c in missing]]).astype(int)
+
+    X_fit = _vstack(X_old[sample], X_new)
+    y_fit = np.concatenate([y_old[sample], np.asarray(y_new)])
+
+    forest.set_params(warm_start=True, n_estimators=forest.n_estimators + n_new_trees)
+    forest.fit(X_fit, y_fit)
+    forest.set_params(warm_start=False)
+    return n_new_trees
+
+
+def _numeric_columns(preprocessor):
+    return list(dict((name, cols) for name, _, cols in preprocessor.transformers_)["num"])
+
+
+def _vstack(a, b):
+    if hasattr(a, "tocsr"):
+        from scipy import sparse
+        return sparse.vstack([a, b]).tocsr()
+    return np.vstack([a, b])
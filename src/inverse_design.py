@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+
+from src.schema import PRINTABILITY_SCHEMA
+
+# Parameters searched by default; the others stay at the starting formulation unless listed in `vary`
+DEFAULT_VARY = ("Gelatin_pct", "Silk_pct", "LH", "PP", "TG_min")
+
+# predict_printability rejects these at zero, so the search never proposes it
+NONZERO = ("TG_min", "PS")
+
+
+def _snap(values, column):
+    step = PRINTABILITY_SCHEMA["steps"][column]
+    low, high = PRINTABILITY_SCHEMA["ranges"][column]
+    if column in NONZERO:
+        low = max(low, step)
+    decimals = max(0, -int(np.floor(np.log10(step))))
+    return np.clip(np.round(np.round(values / step) * step, decimals), low, high)
+
+
+def _known_needles():
+    """Needle sizes the model was trained on; others are encoded as unknown and are not proposed."""
+    from src.predict import get_compiled_preprocessor
+
+    for block in get_compiled_preprocessor().blocks:
+        if block["kind"] == "onehot" and "Needle" in block["columns"]:
+            known = set(block["lookups"][block["columns"].index("Needle")])
+            return [needle for needle in PRINTABILITY_SCHEMA["choices"]["Needle"] if needle in known]
+    return PRINTABILITY_SCHEMA["choices"]["Needle"]
+
+
+def _printable_probability(columns):
+    """P(printable) for a dict of column arrays, in one transform and one predict_proba."""
+    from src.predict import ENGINE_MAX_ROWS, get_compiled_preprocessor, get_engine, get_model
+
+    X = get_compiled_preprocessor().transform(columns)
+    if X.shape[0] <= ENGINE_MAX_ROWS:
+        engine = get_engine()
+        return engine.predict_proba(X)[:, list(engine.classes).index(1)]
+    model = get_model()
+    return model.predict_proba(X)[:, list(model.classes_).index(1)]
+
+
+def find_printable_formulations(start, k=5, vary=DEFAULT_VARY, fixed=None, radius=0.25, distance_weight=0.1,
+                                n_candidates=2048, n_steps=15, n_parents=64, random_state=42):
+    """
+    Search for the most confidently printable formulations near a starting point.
+
+    An evolutionary local search: every step mutates the best formulations found
+    so far into n_candidates new ones on the widget grid, scores all of them with
+    one batched predict_proba, and keeps the best. Candidates stay within the
+    widget ranges and within `radius` (a fraction of each range) of the start.
+
+    Parameters:
+        start (dict): Starting formulation with every model feature (as passed to predict_printability)
+        k (int): Number of formulations to return
+        vary (iterable of str): Numeric parameters the search may change
+        fixed (dict): Constraints, e.g. {"Needle": "22G"} or {"Used_crosslinker": 0}.
+            Needle may change to another size the model was trained on unless fixed;
+            other parameters outside `vary` keep their start value.
+        radius (float): Largest change of each varied parameter, as a fraction of its widget range
+        distance_weight (float): Score penalty per unit of mean relative distance from the start,
+            so that equally printable formulations closer to the start rank first
+        n_candidates (int): Formulations scored per step
+        n_steps (int): Search steps
+        n_parents (int): Best formulations mutated in each step
+        random_state (int): Seed
+
+    Returns:
+        pd.DataFrame: The k best formulations, with Printable_Probability and
+        Distance (mean change relative to the widget ranges) columns, best first
+    """
+    rng = np.random.default_rng(random_state)
+    fixed = dict(fixed or {})
+    ranges = PRINTABILITY_SCHEMA["ranges"]
+    varied = [column for column in vary if column not in fixed]
+    start = {**start, **fixed}
+    for column in varied:
+        start[column] = float(_snap(np.float64(start[column]), column))
+    needles = [start["Needle"]] if "Needle" in fixed else _known_needles()
+
+    width = {c: float(np.ptp(ranges[c])) for c in varied}
+    low = {c: max(ranges[c][0], start[c] - radius * width[c]) for c in varied}
+    high = {c: min(ranges[c][1], start[c] + radius * width[c]) for c in varied}
+    searched = varied + ["Needle"]
+
+    def evaluate(population):
+        n = len(population["Needle"])
+        columns = {c: np.full(n, v, dtype=object if isinstance(v, str) else np.float64) for c, v in start.items()}
+        columns.update(population)
+        distance = np.zeros(n)
+        for c in varied:
+            distance += np.abs(population[c] - start[c]) / width[c] / len(varied)
+        return pd.DataFrame(population).assign(Printable_Probability=_printable_probability(columns),
+                                               Distance=distance)
+
+    # First population: the start itself plus uniform samples of the region around it
+    population = {c: _snap(np.append(start[c], rng.uniform(low[c], high[c], n_candidates - 1)), c) for c in varied}
+    population["Needle"] = np.append(start["Needle"], rng.choice(needles, n_candidates - 1)).astype(object)
+
+    best = None
+    for step in range(n_steps):
+        candidates = evaluate(population)
+        best = candidates if best is None else pd.concat([best, candidates], ignore_index=True)
+        best = best.drop_duplicates(subset=searched)
+        score = best["Printable_Probability"] - distance_weight * best["Distance"]
+        best = best.loc[score.sort_values(ascending=False, kind="stable").index[:max(n_parents, k)]]
+
+        # Mutate the best formulations; steps shrink as the search settles
+        parents = best.iloc[rng.integers(0, min(n_parents, len(best)), n_candidates)]
+        spread = 0.25 * (1 - step / n_steps) + 0.02
+        population = {}
+        for c in varied:
+            moved = parents[c].to_numpy(dtype=np.float64) + rng.normal(0, spread * width[c], n_candidates)
+            population[c] = _snap(np.clip(moved, low[c], high[c]), c)
+        swap = rng.random(n_candidates) < 0.1
+        population["Needle"] = np.where(swap, rng.choice(needles, n_candidates), parents["Needle"].to_numpy())
+
+    result = best.head(k).reset_index(drop=True)
+    result = result.assign(**{c: start[c] for c in start if c not in result.columns})
+    features = [c for c in PRINTABILITY_SCHEMA["features"] if c in result.columns]
+    return result[features + ["Printable_Probability", "Distance"]]
@@ -0,0 +1,150 @@
+import itertools
+
+import joblib
+import numpy as np
+
+DEFAULT_MAX_CELLS = 10_000_000
+
+
+class LookupGrid:
+    """
+    Table of a forest's predictions over every region its split thresholds define.
+
+    A tree only ever asks whether a feature is <= one of its thresholds, so along
+    each feature the forest's output can only change at one of the thresholds
+    used anywhere in the forest. Cutting every feature at those values gives a
+    grid of cells in which all trees reach the same leaves. One prediction per
+    cell, taken at a point inside it, is therefore exactly what the forest
+    predicts for any input in that cell, and predicting becomes one binary
+    search per feature and an array lookup.
+
+    Missing values have no cell: each split sends them left or right on its own
+    (missing_go_to_left), so a NaN feature does not behave like any one value.
+    Rows with NaN are rejected; predict them with the forest instead.
+
+    Like FlatForest, the object only holds plain arrays and can be saved with
+    compress=0 and memory-mapped back.
+
+    Parameters:
+        cuts (np.ndarray): Sorted thresholds of all features, concatenated
+        cut_offsets (np.ndarray): Start of each feature's thresholds in cuts (n_features + 1 entries)
+        values (np.ndarray): Forest outputs per cell, shape (*cells per feature, n_outputs)
+        kind (str): "classifier" (values are class probabilities) or "regressor"
+        classes (np.ndarray): Class labels of a classifier
+        squeeze (bool): Return 1-D predictions, as a single-output regressor does
+        source_version (str): Content hash of the model file the grid was built from
+    """
+
+    def __init__(self, cuts, cut_offsets, values, kind, classes=None, squeeze=False, source_version=None):
+        self.cuts = cuts
+        self.cut_offsets = cut_offsets
+        self.values = values
+        self.kind = kind
+        self.classes = classes
+        self.squeeze = squeeze
+        self.source_version = source_version
+
+    @classmethod
+    def from_forest(cls, forest, source_version=None, max_cells=DEFAULT_MAX_CELLS, batch_size=100_000):
+        """
+        Tabulate a FlatForest over all of its threshold cells.
+
+        Parameters:
+            forest (FlatForest): Fitted flat forest
+            source_version (str): Content hash of the model file, checked before the grid is used
+            max_cells (int): Refuse grids with more cells than this
+            batch_size (int): Cells predicted per step
+
+        Returns:
+            LookupGrid
+
+        Raises:
+            ValueError: If the grid would have more than max_cells cells
+        """
+        split = np.isfinite(forest.threshold)  # leaves carry an infinite threshold
+        cuts_per_feature = [np.unique(forest.threshold[split & (forest.feature == j)])
+                            for j in range(forest.n_features_in)]
+        shape = tuple(len(cuts) + 1 for cuts in cuts_per_feature)
+        n_cells = int(np.prod(shape, dtype=np.float64))
+        if n_cells > max_cells:
+            raise ValueError(f"The forest splits its {forest.n_features_in} features into {n_cells:,} cells "
+                             f"(more than max_cells={max_cells:,})")
+
+        points = [_cell_points(cuts) for cuts in cuts_per_feature]
+        outputs = forest.predict_proba if forest.kind == "classifier" else forest.predict
+        cells = itertools.product(*points)  # C order, matching the reshape below
+        chunks = []
+        while True:
+            X = np.array(list(itertools.islice(cells, batch_size)), dtype=np.float32)
+            if len(X) == 0:
+                break
+            chunks.append(np.asarray(outputs(X), dtype=np.float64).reshape(len(X), -1))
+        values = np.concatenate(chunks).reshape(shape + (-1,))
+
+        offsets = np.cumsum([0] + [len(cuts) for cuts in cuts_per_feature])
+        return cls(np.concatenate(cuts_per_feature), offsets, values, forest.kind, forest.classes,
+                   forest.squeeze, source_version)
+
+    @property
+    def n_cells(self):
+        return int(np.prod(self.values.shape[:-1]))
+
+    def cell_index(self, X):
+        """
+        Flat cell number of every row of preprocessed features X.
+
+        Raises:
+            ValueError: If X contains NaN, which the grid cannot place
+        """
+        # The forests compare float32 features against float64 thresholds
+        X = np.asarray(X, dtype=np.float32).astype(np.float64)
+        if np.isnan(X).any():
+            raise ValueError("LookupGrid cannot predict rows with missing values; use the forest for those rows")
+        all_cuts = np.asarray(self.cuts)  # a plain view of the memory map slices faster
+        position = np.zeros(X.shape[0], dtype=np.intp)
+        for j, size in enumerate(self.values.shape[:-1]):
+            cuts = all_cuts[self.cut_offsets[j]:self.cut_offsets[j + 1]]
+            # Number of thresholds below x; x <= cut sends a row left, so x == cut stays in the lower cell
+            position = position * size + np.searchsorted(cuts, X[:, j], side="left")
+        return position
+
+    def _outputs(self, X):
+        values = np.asarray(self.values)
+        return values.reshape(-1, values.shape[-1])[self.cell_index(X)]
+
+    def predict_proba(self, X):
+        """Class probabilities, identical to the source forest's."""
+        if self.kind != "classifier":
+            raise TypeError("predict_proba is only available for classifiers")
+        return self._outputs(X)
+
+    def predict(self, X):
+        """Labels or regression targets, identical to the source forest's."""
+        outputs = self._outputs(X)
+        if self.kind == "classifier":
+            return self.classes.take(np.argmax(outputs, axis=1), axis=0)
+        return outputs[:, 0] if self.squeeze else outputs
+
+
+def _cell_points(cuts):
+    """One float32 value inside each cell that the sorted thresholds cut a feature into."""
+    if len(cuts) == 0:
+        return np.zeros(1, dtype=np.float32)
+    points = cuts.astype(np.float32)
+    # Largest float32 <= each cut (the cell's upper end); then one value above the last cut
+    above = points.astype(np.float64) > cuts
+    points[above] = np.nextafter(points[above], np.float32(-np.inf))
+    last = np.float32(cuts[-1])
+    if last <= cuts[-1]:
+        last = np.nextafter(last, np.float32(np.inf))
+    return np.append(points, last)
+
+
+def export_lookup_grid(grid, path):
+    """Save a LookupGrid uncompressed, so load_lookup_grid can map it read-only."""
+    joblib.dump(grid, path, compress=0)
+
+
+def load_lookup_grid(path, mmap_mode="r"):
+    """Load a grid saved by export_lookup_grid, memory-mapping its arrays by default."""
+    return joblib.load(path, mmap_mode=mmap_mode)
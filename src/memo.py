@@ -0,0 +1,245 @@
+import math
+import numbers
+import os
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from src.registry import file_version
+from src.schema import DEGRADATION_SCHEMA, PRINTABILITY_SCHEMA
+
+DEFAULT_MAXSIZE = 4096
+
+
+def quantize(row, steps):
+    """
+    Hashable cache key for an input; the input itself is not changed.
+
+    A stepped feature whose value lies on its widget grid (up to float noise, so
+    0.1 + 0.2 and 0.3 agree) is keyed by its grid index. Any other value is keyed
+    as it is, so only inputs that predict identically share an entry. Missing
+    values (None or NaN) share one key per feature.
+
+    Parameters:
+        row (dict): Feature name -> value
+        steps (dict): Feature name -> step size; other features are keyed by their exact value
+
+    Returns:
+        tuple: Key of (feature, value) pairs
+    """
+    key = []
+    for column in sorted(row):
+        value = row[column]
+        if value is None or (isinstance(value, numbers.Real) and math.isnan(value)):
+            key.append((column, None))
+            continue
+        units = _grid_units(value, steps.get(column))
+        key.append((column, ("step", units)) if units is not None else (column, value))
+    return tuple(key)
+
+
+def _grid_units(value, step):
+    """Grid index of a value that lies on the step grid, otherwise None."""
+    if step is None:
+        return None
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    if not math.isfinite(value):
+        return None
+    units = round(value / step)
+    return units if math.isclose(units * step, value, rel_tol=1e-9, abs_tol=1e-12) else None
+
+
+class PredictionMemo:
+    """
+    LRU cache in front of a predictor, keyed by the quantized input.
+
+    Only the key is quantized: misses are predicted on the input as given, and
+    only inputs equal up to float noise share an entry, so a cached result is
+    what the predictor returns for that input. Entries belong to one
+    version of the model files; when a file changes, the cache starts empty.
+
+    Parameters:
+        predict (callable): input dict -> result
+        predict_batch (callable): list of input dicts -> list of results (defaults to calling predict per row)
+        steps (dict): Feature name -> step size
+        paths (list of str): Model files whose content versions the entries
+        maxsize (int): Entries kept in memory
+        disk_path (str): Optional SQLite file that keeps entries across processes and restarts
+        name (str): Model the entries belong to; memos for different models can share one disk_path
+    """
+
+    def __init__(self, predict, steps, paths, predict_batch=None, maxsize=DEFAULT_MAXSIZE, disk_path=None,
+                 name="default"):
+        self.name = name
+        self.predict = predict
+        self.predict_batch = predict_batch or (lambda rows: [predict(row) for row in rows])
+        self.steps = steps
+        self.paths = list(paths)
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+        self._db = None
+        if disk_path is not None:
+            os.makedirs(os.path.dirname(os.path.abspath(disk_path)), exist_ok=True)
+            self._db = sqlite3.connect(disk_path, check_same_thread=False)  # all access holds self._lock
+            self._db.execute("CREATE TABLE IF NOT EXISTS predictions (model TEXT, version TEXT, key TEXT, "
+                             "value BLOB, PRIMARY KEY (model, version, key))")
+        self.counters = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def version(self):
+        """Content version of the model files the entries belong to."""
+        return ":".join(file_version(path)[:16] for path in self.paths if os.path.exists(path))
+
+    def __call__(self, row):
+        """Return the prediction for one input dict."""
+        return self.predict_many([row])[0]
+
+    def predict_many(self, rows):
+        """
+        Return predictions for a list of input dicts, predicting only the uncached ones in one batch.
+        """
+        keys = [quantize(row, self.steps) for row in rows]
+        results = [None] * len(rows)
+        missing = {}
+        with self._lock:
+            version = self._check_version()
+            for i, key in enumerate(keys):
+                found, value = self._lookup(version, key)
+                if found:
+                    results[i] = value
+                else:
+                    missing.setdefault(key, []).append(i)
+
+        if missing:
+            # Duplicates within one batch are predicted once
+            inputs = [rows[positions[0]] for positions in missing.values()]
+            values = [self.predict(inputs[0])] if len(inputs) == 1 else self.predict_batch(inputs)
+            with self._lock:
+                for (key, positions), value in zip(missing.items(), values):
+                    self._store(version, key, value)
+                    for i in positions:
+                        results[i] = value
+        return results
+
+    def _check_version(self):
+        version = self.version()
+        if version != self._version:
+            if self._version is not None:
+                self.counters["invalidations"] += 1
+            self._entries.clear()
+            if self._db is not None:
+                with self._db:
+                    self._db.execute("DELETE FROM predictions WHERE model = ? AND version != ?",
+                                     (self.name, version))
+            self._version = version
+        return version
+
+    def _lookup(self, version, key):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.counters["hits"] += 1
+            return True, self._entries[key]
+        if self._db is not None:
+            found = self._db.execute("SELECT value FROM predictions WHERE model = ? AND version = ? AND key = ?",
+                                     (self.name, version, repr(key))).fetchone()
+            if found is not None:
+                value = pickle.loads(found[0])
+                self._remember(key, value)
+                self.counters["disk_hits"] += 1
+                return True, value
+        self.counters["misses"] += 1
+        return False, None
+
+    def _store(self, version, key, value):
+        if version != self._version:
+            return  # the model changed while this batch was predicted
+        self._remember(key, value)
+        if self._db is not None:
+            with self._db:
+                self._db.execute("INSERT OR REPLACE INTO predictions VALUES (?, ?, ?, ?)",
+                                 (self.name, version, repr(key), pickle.dumps(value)))
+
+    def _remember(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.counters["evictions"] += 1
+
+    def stats(self):
+        """Return hit/miss counters, the hit rate and the number of cached entries."""
+        with self._lock:
+            stats = dict(self.counters)
+            stats["size"] = len(self._entries)
+            if self._db is not None:
+                stats["disk_size"] = self._db.execute("SELECT COUNT(*) FROM predictions WHERE model = ?",
+                                                      (self.name,)).fetchone()[0]
+        lookups = stats["hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """Drop every entry of this model, in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                with self._db:
+                    self._db.execute("DELETE FROM predictions WHERE model = ?", (self.name,))
+
+
+def _printability_one(row):
+    from src.predict import predict_printability
+    return int(predict_printability(row))
+
+
+def _printability_many(rows):
+    from src.predict import predict_printability_batch
+    return [int(p) for p in predict_printability_batch(rows)]
+
+
+def _degradation_one(row):
+    from degradation_project.predict import predict_degradation
+    return {name: float(value) for name, value in predict_degradation(row).items()}
+
+
+def _degradation_many(rows):
+    from degradation_project.predict import predict_degradation_batch
+    columns = predict_degradation_batch(rows, as_frame=False)
+    return [{name: float(values[i]) for name, values in columns.items()} for i in range(len(rows))]
+
+
+def _printability_paths():
+    from src import predict
+    return [predict.model_path, predict.flat_model_path, predict.preprocessor_path]
+
+
+def _degradation_paths():
+    from degradation_project import predict
+    return [predict.MODEL_PATH, predict.FLAT_MODEL_PATH, predict.PREPROCESSOR_PATH]
+
+
+_MODELS = {
+    "printability": (_printability_one, _printability_many, PRINTABILITY_SCHEMA, _printability_paths),
+    "degradation": (_degradation_one, _degradation_many, DEGRADATION_SCHEMA, _degradation_paths),
+}
+_memos = {}
+_memos_lock = threading.Lock()
+
+
+def get_memo(model, maxsize=DEFAULT_MAXSIZE, disk_path=None):
+    """
+    Return the process-wide memoized predictor for "printability" or "degradation".
+
+    The first call creates it with the given maxsize and disk_path; later calls return the same one.
+    """
+    with _memos_lock:
+        if model not in _memos:
+            predict, predict_batch, schema, paths = _MODELS[model]
+            _memos[model] = PredictionMemo(predict, schema["steps"], paths(), predict_batch=predict_batch,
+                                           maxsize=maxsize, disk_path=disk_path, name=model)
+        return _memos[model]
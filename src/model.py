@@ -1,7 +1,18 @@
-from sklearn.ensemble import RandomForestClassifier
 import joblib
 import pandas as pd
 
+from src.flat_forest import FlatForest
+from src.registry import file_version
+
+# Forest parameters explored by main.py --search
+SEARCH_PARAM_GRID = {
+    "n_estimators": [100, 300],
+    "max_depth": [None, 8, 16],
+    "min_samples_leaf": [1, 2, 4],
+    "max_features": ["sqrt", 0.5, 1.0],
+}
+
+
 def train_model(X_train, y_train, model_type="random_forest"):
     """
     Train a machine learning model.
@@ -14,6 +25,9 @@ def train_model(X_train, y_train, model_type="random_forest"):
     Returns:
         Trained model object
     """
+    # Imported here so that prediction, which only loads models, does not pay for sklearn.ensemble
+    from sklearn.ensemble import RandomForestClassifier
+
     if model_type == "random_forest":
         model = RandomForestClassifier(n_estimators=100, random_state=42)
     else:
@@ -70,3 +84,35 @@ def load_model(path):
         Loaded model
     """
     return joblib.load(path)
+
+
+def export_flat_model(model, path, source_path=None):
+    """
+    Save a fitted forest as flat node arrays that can be memory-mapped.
+
+    The file is written uncompressed so load_flat_model can map it read-only;
+    worker processes then share the node arrays instead of each holding a copy.
+
+    Parameters:
+        model: Fitted RandomForestClassifier (or any model FlatForest supports)
+        path (str): File path to save the flat model
+        source_path (str): The saved pickle of `model`; its content hash is stored so
+                           predict.py ignores the export once the pickle changes
+    """
+    flat = FlatForest.from_estimator(model)
+    flat.source_version = file_version(source_path) if source_path else None
+    joblib.dump(flat, path, compress=0)
+
+
+def load_flat_model(path, mmap_mode="r"):
+    """
+    Load a model saved by export_flat_model.
+
+    Parameters:
+        path (str): File path to load the flat model from
+        mmap_mode (str or None): 'r' to memory-map the node arrays, None to read them into memory
+
+    Returns:
+        FlatForest
+    """
+    return joblib.load(path, mmap_mode=mmap_mode)
@@ -0,0 +1,202 @@
+import os
+
+import numpy as np
+import pandas as pd
+from sklearn.impute import SimpleImputer
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+from src.data_preprocessing import build_preprocessor
+from src.incremental import row_hashes
+from src.schema import PRINTABILITY_SCHEMA, iter_dataset, select_features, to_model_dtypes
+
+
+def fit_preprocessor_chunked(path, target_column, chunksize=100_000, schema=PRINTABILITY_SCHEMA):
+    """
+    Fit the preprocess_data transformer in one pass over a dataset file, a chunk at a time.
+
+    Imputation means, scaler statistics, most frequent categories and one-hot
+    vocabularies are accumulated per chunk (means and variances are merged with
+    the parallel-variance formula). A ColumnTransformer from build_preprocessor is
+    then fitted on a tiny stand-in frame to set up its structure, and the
+    accumulated statistics are written into it. The result transforms like one
+    fitted on the whole file in memory.
+
+    Parameters:
+        path (str): CSV, Parquet or Feather file
+        target_column (str): Target column; rows where it is missing are skipped
+        chunksize (int): Rows read per step
+        schema (dict): Dataset schema the file is read with
+
+    Returns:
+        dict: preprocessor, n_rows (rows with a target), row_hashes and imputer_counts
+              (non-missing values per numeric column, as stored in the training manifest)
+    """
+    preprocessor = numeric = categorical = None
+    hashes = []
+    for chunk in iter_dataset(path, schema, chunksize):
+        chunk = chunk.dropna(subset=[target_column])
+        X = to_model_dtypes(select_features(chunk, schema), schema)
+        if preprocessor is None:
+            preprocessor = build_preprocessor(X)
+            columns = dict((name, cols) for name, _, cols in preprocessor.transformers)
+            numeric = _NumericStats(columns["num"])
+            categorical = _CategoryStats(columns["cat"])
+            template = X.iloc[:1]
+        numeric.update(X)
+        categorical.update(X)
+        hashes.append(row_hashes(chunk))
+
+    if preprocessor is None or numeric.n_rows == 0:
+        raise ValueError(f"No rows with a '{target_column}' value in {path}")
+
+    # SimpleImputer drops a column it sees no value in, so the stand-in's missing numerics
+    # are filled in (the accumulated statistics replace whatever it is fitted on)
+    template = template.fillna(dict(zip(numeric.columns, numeric.mean)))
+    preprocessor.fit(categorical.stand_in(template))
+    numeric.apply(preprocessor.named_transformers_["num"])
+    categorical.apply(preprocessor.named_transformers_["cat"])
+    return {
+        "preprocessor": preprocessor,
+        "n_rows": numeric.n_rows,
+        "row_hashes": np.concatenate(hashes),
+        "imputer_counts": numeric.count,
+    }
+
+
+def split_rows(n_rows, test_size=0.2, random_state=42):
+    """Positions (among the rows with a target) of the train and test rows used by transform_to_memmap."""
+    return train_test_split(np.arange(n_rows), test_size=test_size, random_state=random_state)
+
+
+def transform_to_memmap(path, preprocessor, target_column, n_rows, out_dir, chunksize=100_000,
+                        test_size=0.2, random_state=42, schema=PRINTABILITY_SCHEMA):
+    """
+    Transform a dataset chunk by chunk into on-disk train and test matrices.
+
+    Rows are assigned to train and test with the same train_test_split call as
+    preprocess_data, and written at the same positions, so the matrices equal
+    preprocess_data's output (stored as float32, the precision the forests split on).
+
+    Parameters:
+        path (str): CSV, Parquet or Feather file
+        preprocessor: Fitted transformer, e.g. from fit_preprocessor_chunked
+        target_column (str): Target column; rows where it is missing are skipped
+        n_rows (int): Rows with a target, from fit_preprocessor_chunked
+        out_dir (str): Directory for X_train.npy, X_test.npy, y_train.npy and y_test.npy
+        chunksize (int): Rows read per step
+        test_size (float), random_state (int): Passed to train_test_split
+        schema (dict): Dataset schema the file is read with
+
+    Returns:
+        tuple: X_train, X_test, y_train, y_test as read-only memory maps
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    train_rows, test_rows = split_rows(n_rows, test_size, random_state)
+    # Position of every row within its split; -1 where the row belongs to the other split
+    slot = {}
+    for name, rows in (("train", train_rows), ("test", test_rows)):
+        slot[name] = np.full(n_rows, -1, dtype=np.intp)
+        slot[name][rows] = np.arange(len(rows))
+
+    files = {}
+    offset = 0
+    for chunk in iter_dataset(path, schema, chunksize):
+        chunk = to_model_dtypes(chunk.dropna(subset=[target_column]), schema)
+        X = preprocessor.transform(select_features(chunk, schema))
+        X = X.toarray() if hasattr(X, "toarray") else X
+        y = chunk[target_column].to_numpy()
+        if not files:
+            for name, rows in (("train", train_rows), ("test", test_rows)):
+                files[f"X_{name}"] = np.lib.format.open_memmap(
+                    os.path.join(out_dir, f"X_{name}.npy"), mode="w+", dtype=np.float32,
+                    shape=(len(rows), X.shape[1]))
+                files[f"y_{name}"] = np.lib.format.open_memmap(
+                    os.path.join(out_dir, f"y_{name}.npy"), mode="w+", dtype=y.dtype, shape=(len(rows),))
+
+        for name in ("train", "test"):
+            positions = slot[name][offset:offset + len(chunk)]
+            mine = positions >= 0
+            files[f"X_{name}"][positions[mine]] = X[mine]
+            files[f"y_{name}"][positions[mine]] = y[mine]
+        offset += len(chunk)
+
+    for array in files.values():
+        array.flush()
+    del files
+    return tuple(np.load(os.path.join(out_dir, f"{name}.npy"), mmap_mode="r")
+                 for name in ("X_train", "X_test", "y_train", "y_test"))
+
+
+class _NumericStats:
+    """Running count, mean and sum of squared deviations of the non-missing values per column."""
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.n_rows = 0
+        self.count = np.zeros(len(self.columns), dtype=np.int64)
+        self.mean = np.zeros(len(self.columns))
+        self.m2 = np.zeros(len(self.columns))
+
+    def update(self, X):
+        values = X[self.columns].to_numpy(dtype=np.float64)
+        self.n_rows += len(values)
+        present = ~np.isnan(values)
+        count = present.sum(axis=0)
+        total = np.where(present, values, 0.0).sum(axis=0)
+        mean = np.divide(total, count, out=np.zeros_like(total), where=count > 0)
+        m2 = np.where(present, (values - mean) ** 2, 0.0).sum(axis=0)
+
+        merged = self.count + count
+        delta = mean - self.mean
+        weight = np.divide(count, merged, out=np.zeros_like(self.mean), where=merged > 0)
+        self.m2 += m2 + delta ** 2 * self.count * weight
+        self.mean += delta * weight
+        self.count = merged
+
+    def apply(self, pipeline):
+        imputer = next(s for _, s in pipeline.steps if isinstance(s, SimpleImputer))
+        scaler = next(s for _, s in pipeline.steps if isinstance(s, StandardScaler))
+        imputer.statistics_ = self.mean.copy()
+        # Imputed values sit exactly on the mean, so they add rows but no deviation
+        scaler.n_samples_seen_ = self.n_rows
+        scaler.mean_ = self.mean.copy()
+        scaler.var_ = self.m2 / self.n_rows
+        scale = np.sqrt(scaler.var_)
+        scale[scale < 10 * np.finfo(scale.dtype).eps] = 1.0  # constant columns, as in StandardScaler
+        scaler.scale_ = scale
+
+
+class _CategoryStats:
+    """Running value counts per categorical column."""
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.counts = {column: pd.Series(dtype=np.int64) for column in self.columns}
+
+    def update(self, X):
+        for column in self.columns:
+            counts = X[column].value_counts(dropna=True)
+            self.counts[column] = self.counts[column].add(counts, fill_value=0).astype(np.int64)
+
+    def stand_in(self, template):
+        """A small frame with the template's dtypes in which every category occurs."""
+        n = max([1] + [len(counts) for counts in self.counts.values()])
+        stand_in = template.iloc[np.zeros(n, dtype=np.intp)].reset_index(drop=True)
+        for column in self.columns:
+            values = sorted(self.counts[column].index)
+            values += values[-1:] * (n - len(values))
+            stand_in[column] = pd.array(values, dtype=template[column].dtype)
+        return stand_in
+
+    def apply(self, pipeline):
+        imputer = next(s for _, s in pipeline.steps if isinstance(s, SimpleImputer))
+        encoder = next(s for _, s in pipeline.steps if isinstance(s, OneHotEncoder))
+        # most_frequent breaks ties by taking the smallest value
+        modes = [min(c.index[c == c.max()]) for c in (self.counts[column] for column in self.columns)]
+        statistics = imputer.statistics_.copy()
+        statistics[:] = modes
+        imputer.statistics_ = statistics
+        for categories, column in zip(encoder.categories_, self.columns):
+            if list(categories) != sorted(self.counts[column].index):
+                raise RuntimeError(f"One-hot vocabulary for '{column}' does not match the data")
@@ -1,14 +1,83 @@
 import os
-import joblib
+import numpy as np
 import pandas as pd
 
+from src.compiled_preprocessor import CompiledPreprocessor
+from src.flat_forest import FlatForest
+from src.model import load_flat_model, load_model
+from src.registry import file_version, load_artifact
+
 # Define paths to model and preprocessor (relative to project root)
 model_path = os.path.join("outputs", "models", "printability_model.pkl")
+flat_model_path = os.path.join("outputs", "models", "printability_model_flat.pkl")
 preprocessor_path = os.path.join("outputs", "models", "preprocessor.pkl")
 
-# Load once (global)
-model = joblib.load(model_path)
-preprocessor = joblib.load(preprocessor_path)
+# The flat engine is faster up to about this many rows; sklearn's compiled loop wins above it
+ENGINE_MAX_ROWS = 256
+
+
+def get_model():
+    """Return the printability model, loading it on first use."""
+    return load_artifact(model_path)
+
+
+def get_engine():
+    """
+    Return the flat-array inference engine for the printability model.
+
+    Memory-maps the exported flat model when it was exported from the current
+    pickle, otherwise flattens the pickle. Predictions are identical to get_model().
+    """
+    if _flat_model_is_current():
+        return load_artifact(flat_model_path, loader=load_flat_model, key="flat")
+    return load_artifact(model_path, loader=lambda path: FlatForest.from_estimator(load_model(path)), key="flat")
+
+
+def _flat_model_is_current():
+    """Whether the flat export exists and matches the pickle (or there is no pickle to compare with)."""
+    if not os.path.exists(flat_model_path):
+        return False
+    if not os.path.exists(model_path):
+        return True
+    flat = load_artifact(flat_model_path, loader=load_flat_model, key="flat")
+    return getattr(flat, "source_version", None) == file_version(model_path)
+
+
+def get_preprocessor():
+    """Return the fitted preprocessor, loading it on first use."""
+    return load_artifact(preprocessor_path)
+
+
+def get_compiled_preprocessor():
+    """Return the fitted preprocessor compiled to NumPy; transforms exactly like get_preprocessor()."""
+    return load_artifact(
+        preprocessor_path,
+        loader=lambda path: CompiledPreprocessor.from_column_transformer(load_model(path)),
+        key="compiled",
+    )
+
+
+def warm_up():
+    """Load the inference engine and preprocessor ahead of the first prediction."""
+    get_engine()
+    get_compiled_preprocessor()
+
+
+def _predict(X):
+    """Predict preprocessed rows with whichever backend is faster for this batch size."""
+    if X.shape[0] <= ENGINE_MAX_ROWS:
+        return get_engine().predict(X)
+    return get_model().predict(X)
+
+
+def __getattr__(name):
+    # Keep `from src.predict import model, preprocessor` working without import-time loading
+    if name == "model":
+        return get_model()
+    if name == "preprocessor":
+        return get_preprocessor()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def predict_printability(input_data: dict) -> int:
     """
@@ -24,10 +93,49 @@ def predict_printability(input_data: dict) -> int:
     if float(input_data.get("TG_min", 1)) == 0.0 or float(input_data.get("PS", 1)) == 0.0:
         return 0  # Not printable due to critical parameter being zero
 
-    # Format input
-    df = pd.DataFrame([input_data])
-    df = df[list(preprocessor.feature_names_in_)]  # Match training feature order
+    # Transform (columns are looked up by name, so order does not matter) and predict
+    X = get_compiled_preprocessor().transform_one(input_data)
+    return _predict(X)[0]
+
+
+def _to_frame(inputs) -> pd.DataFrame:
+    """Convert a DataFrame, list of dicts or NumPy structured array to a DataFrame."""
+    if isinstance(inputs, pd.DataFrame):
+        return inputs
+    if isinstance(inputs, np.ndarray):
+        if inputs.dtype.names is None:
+            raise TypeError("NumPy input must be a structured array with named fields")
+        return pd.DataFrame.from_records(inputs)
+    if isinstance(inputs, dict):
+        raise TypeError("Use predict_printability for a single dict input")
+    return pd.DataFrame(list(inputs))
+
+
+def predict_printability_batch(inputs) -> np.ndarray:
+    """
+    Predict the printability of many bio-ink formulations at once.
+    Same rule as predict_printability: rows with TG_min or PS == 0 are Not Printable.
+
+    Args:
+        inputs (pd.DataFrame, list of dict or np.ndarray): One formulation per row.
+            NumPy input must be a structured array whose field names are the features.
+    Returns:
+        np.ndarray: 1 (printable) or 0 (not printable) for each row, in input order.
+    """
+    df = _to_frame(inputs)
+    predictions = np.zeros(len(df), dtype=get_engine().classes.dtype)
+
+    # Rule-based override, as a mask over the whole batch
+    overridden = np.zeros(len(df), dtype=bool)
+    for column in ("TG_min", "PS"):
+        if column in df.columns:
+            overridden |= (df[column].astype(float) == 0.0).to_numpy()
+
+    keep = ~overridden
+    if not keep.any():
+        return predictions
 
-    # Transform and predict
-    X = preprocessor.transform(df)
-    return model.predict(X)[0]
+    # One transform and one predict for all remaining rows
+    X = get_compiled_preprocessor().transform(df[keep] if overridden.any() else df)
+    predictions[keep] = _predict(X)
+    return predictions
@@ -0,0 +1,129 @@
+import hashlib
+import os
+import threading
+
+import joblib
+
+# Process-wide artifact cache: (absolute path, key) -> entry dict
+_cache = {}
+# Content hashes of files that are versioned without being loaded: absolute path -> (stamp, hash)
+_versions = {}
+_lock = threading.RLock()
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """
+    Compute the SHA-256 hex digest of a file.
+
+    Parameters:
+        path (str): File to hash
+        chunk_size (int): Bytes read per step
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _stamp(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_artifact(path, loader=None, key="joblib"):
+    """
+    Load an artifact on first use and serve it from a process-wide cache afterwards.
+
+    The file is stat'ed on every call. When its mtime or size changes, its SHA-256
+    is recomputed and the artifact is reloaded only if the content really changed.
+
+    Parameters:
+        path (str): Artifact file path
+        loader (callable): Function path -> object (default: joblib.load)
+        key (str): Distinguishes several loaders for the same file
+
+    Returns:
+        The loaded artifact
+    """
+    path = os.path.abspath(path)
+    cache_key = (path, key)
+    stamp = _stamp(path)
+
+    with _lock:
+        entry = _cache.get(cache_key)
+        if entry is not None:
+            if entry["stamp"] == stamp:
+                return entry["artifact"]
+            digest = file_hash(path)
+            if entry["hash"] == digest:
+                entry["stamp"] = stamp
+                return entry["artifact"]
+        else:
+            digest = file_hash(path)
+
+        artifact = (loader or joblib.load)(path)
+        _cache[cache_key] = {"stamp": stamp, "hash": digest, "artifact": artifact}
+        return artifact
+
+
+def artifact_version(path):
+    """
+    Return the SHA-256 of an artifact, as recorded by the cache.
+
+    Loads the artifact if it is not cached yet, so the version always matches
+    the object that load_artifact returns.
+
+    Parameters:
+        path (str): Artifact file path
+
+    Returns:
+        str: Hex digest of the file content
+    """
+    path = os.path.abspath(path)
+    with _lock:
+        entry = _cache.get((path, "joblib"))
+        if entry is None or entry["stamp"] != _stamp(path):
+            load_artifact(path)
+            entry = _cache[(path, "joblib")]
+        return entry["hash"]
+
+
+def file_version(path):
+    """
+    Return the SHA-256 of a file without loading it, rehashing only when its mtime or size changes.
+
+    Parameters:
+        path (str): File path
+
+    Returns:
+        str: Hex digest of the file content
+    """
+    path = os.path.abspath(path)
+    stamp = _stamp(path)
+    with _lock:
+        entry = _versions.get(path)
+        if entry is None or entry[0] != stamp:
+            entry = _versions[path] = (stamp, file_hash(path))
+        return entry[1]
+
+
+def warm_up(*paths):
+    """
+    Load the given artifacts now so the first prediction does not pay for it.
+
+    Parameters:
+        *paths (str): Artifact file paths
+    """
+    for path in paths:
+        load_artifact(path)
+
+
+def clear_cache():
+    """Drop every cached artifact."""
+    with _lock:
+        _cache.clear()
+        _versions.clear()
@@ -0,0 +1,227 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# Column name -> dtype used when reading each dataset. Features are float64 or
+# category; the role a column plays in preprocessing follows from its dtype here,
+# never from what the parser happened to infer. Numerics stay float64 so training
+# sees the same values as predictions, which arrive as Python floats.
+PRINTABILITY_SCHEMA = {
+    "features": {
+        "Gelatin_pct": "float64",
+        "Silk_pct": "float64",
+        "LH": "float64",
+        "PP": "float64",
+        "PS": "float64",
+        "T": "float64",
+        "TG_min": "float64",
+        "Used_crosslinker": "float64",
+        "Needle": "category",
+        "Remarks": "category",
+    },
+    "targets": {"Printable": "Int8"},  # nullable, so rows without a label can be read and dropped
+    # Input resolution of the frontend widgets; predictions are memoized at this resolution
+    "steps": {
+        "Gelatin_pct": 0.1,
+        "Silk_pct": 0.1,
+        "LH": 0.01,
+        "PP": 1,
+        "PS": 1,
+        "T": 0.1,
+        "TG_min": 1,
+        "Used_crosslinker": 1,
+    },
+    # (min, max) of the frontend widgets, and the choices offered for categorical inputs
+    "ranges": {
+        "Gelatin_pct": (0.0, 30.0),
+        "Silk_pct": (0.0, 10.0),
+        "LH": (0.0, 1.0),
+        "PP": (0, 100),
+        "PS": (1, 30),
+        "T": (10.0, 40.0),
+        "TG_min": (0, 10),
+        "Used_crosslinker": (0, 1),
+    },
+    "choices": {"Needle": ["22G", "25G", "27G", "30G"]},
+}
+
+DEGRADATION_SCHEMA = {
+    "features": {
+        "Scaffold_Geometry": "category",
+        "Porosity_Percentage": "float64",
+        "Immersion_Time_Days": "float64",
+        "Mechanical_Loading": "float64",
+    },
+    "targets": {
+        "Compressive_Stiffness_MPa": "float64",
+        "Weight_Loss_Percentage": "float64",
+        "Water_Absorption_Percentage": "float64",
+    },
+    "steps": {
+        "Porosity_Percentage": 0.1,  # free text in the frontend; 0.1 % is below measurement precision
+        "Immersion_Time_Days": 1,
+        "Mechanical_Loading": 1,
+    },
+    "ranges": {
+        "Porosity_Percentage": (0.0, 100.0),
+        "Immersion_Time_Days": (0, 150),
+        "Mechanical_Loading": (0, 1),
+    },
+    "choices": {"Scaffold_Geometry": ["Body Centered", "Body Centered Shifted", "Body Centered Cubic"]},
+}
+
+SCHEMAS = {"printability": PRINTABILITY_SCHEMA, "degradation": DEGRADATION_SCHEMA}
+
+BINARY_FORMATS = (".parquet", ".feather")
+
+
+def dtypes(schema):
+    """All column dtypes of a schema, features first."""
+    return {**schema["features"], **schema["targets"]}
+
+
+def feature_roles(schema, columns=None):
+    """
+    Split a schema's features into numeric and categorical columns.
+
+    Parameters:
+        schema (dict): One of the schemas above
+        columns (iterable): Restrict to these columns (e.g. those present in a frame)
+
+    Returns:
+        tuple: (numeric columns, categorical columns), in schema order
+    """
+    names = [c for c in schema["features"] if columns is None or c in set(columns)]
+    categorical = [c for c in names if schema["features"][c] == "category"]
+    numeric = [c for c in names if c not in categorical]
+    return numeric, categorical
+
+
+def schema_for(columns):
+    """
+    Return the schema that declares the most of `columns`.
+
+    Columns no schema declares (an ID or notes column, say) are ignored; the
+    preprocessing built from the schema leaves them out.
+
+    Raises:
+        ValueError: If no schema declares any of the columns, or two declare equally many
+    """
+    columns = set(columns)
+    overlap = sorted(((len(columns & set(dtypes(schema))), name) for name, schema in SCHEMAS.items()), reverse=True)
+    if overlap[0][0] == 0 or (len(overlap) > 1 and overlap[0][0] == overlap[1][0]):
+        raise ValueError(f"Could not tell which dataset schema the columns belong to: {sorted(columns)}")
+    return SCHEMAS[overlap[0][1]]
+
+
+def read_dataset(path, schema, **kwargs):
+    """
+    Read a CSV, Parquet or Feather dataset with the schema's dtypes.
+
+    Columns the schema does not know are read as pandas infers them. Binary files
+    written by convert_data.py already carry the right dtypes and are read as is.
+
+    Parameters:
+        path (str): .csv, .parquet or .feather file
+        schema (dict): One of the schemas above
+        **kwargs: Passed on to pandas.read_csv (e.g. chunksize)
+
+    Returns:
+        pd.DataFrame (or a chunk iterator when chunksize is given for a CSV)
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".parquet":
+        return enforce_dtypes(pd.read_parquet(path), schema)
+    if extension == ".feather":
+        return enforce_dtypes(pd.read_feather(path), schema)
+    return pd.read_csv(path, dtype=dtypes(schema), **kwargs)
+
+
+def iter_dataset(path, schema, chunksize):
+    """
+    Yield a CSV, Parquet or Feather dataset as typed DataFrames of up to chunksize rows.
+
+    Each chunk has its own categories; use to_model_dtypes before combining
+    statistics across chunks.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".parquet":
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield enforce_dtypes(batch.to_pandas(), schema)
+    elif extension == ".feather":
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+        with pa.memory_map(path) as source:
+            reader = ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                batch = reader.get_batch(i)  # zero-copy from the map when the file is uncompressed
+                for start in range(0, batch.num_rows, chunksize):
+                    yield enforce_dtypes(batch.slice(start, chunksize).to_pandas(), schema)
+    else:
+        yield from read_dataset(path, schema, chunksize=chunksize)
+
+
+def select_features(df, schema):
+    """The columns of df that are features of the schema, in df's order; IDs, notes and targets are left out."""
+    return df[[c for c in df.columns if c in schema["features"]]]
+
+
+def enforce_dtypes(df, schema):
+    """Cast the schema's columns of df to their declared dtypes (no copy if they already match)."""
+    wanted = {c: t for c, t in dtypes(schema).items() if c in df.columns and str(df[c].dtype) != t}
+    return df.astype(wanted) if wanted else df
+
+
+def to_model_dtypes(df, schema):
+    """
+    Convert schema columns to the types the estimators see at prediction time.
+
+    Predictions come in as Python floats and strings, so training hands the
+    transformers float64 and object feature columns as well. Nullable integer
+    targets without missing values become plain int64 labels.
+    """
+    numeric, categorical = feature_roles(schema, df.columns)
+    upcast = {**dict.fromkeys(numeric, np.float64), **dict.fromkeys(categorical, object)}
+    for target in schema["targets"]:
+        if target in df.columns and pd.api.types.is_extension_array_dtype(df[target].dtype) \
+                and not df[target].hasnans:
+            upcast[target] = np.int64 if pd.api.types.is_integer_dtype(df[target].dtype) else np.float64
+    return df.astype(upcast)
+
+
+def binary_copy(path):
+    """
+    Return an up-to-date Parquet or Feather copy of a CSV dataset, or the CSV itself.
+
+    A copy counts when it sits next to the CSV with the same base name and is at
+    least as new, and pyarrow is installed to read it. Copies holding float32
+    columns (written when the schema still narrowed numerics) are skipped, since
+    their values are rounded.
+    """
+    base, extension = os.path.splitext(path)
+    if extension.lower() != ".csv":
+        return path
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return path
+    for binary in BINARY_FORMATS:
+        candidate = base + binary
+        if os.path.exists(candidate) and os.path.getmtime(candidate) >= os.path.getmtime(path) \
+                and not _has_float32(candidate):
+            return candidate
+    return path
+
+
+def _has_float32(path):
+    """Whether a Parquet or Feather file stores any float32 column (reads the schema only)."""
+    import pyarrow as pa
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        schema = pq.read_schema(path)
+    else:
+        import pyarrow.ipc as ipc
+        schema = ipc.open_file(path).schema
+    return any(field.type == pa.float32() for field in schema)
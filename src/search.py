@@ -0,0 +1,178 @@
+import math
+import time
+
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.base import clone, is_classifier
+from sklearn.metrics import check_scoring
+from sklearn.model_selection import ParameterGrid, ParameterSampler, check_cv
+
+SEARCH_METHODS = ("grid", "random", "halving")
+
+
+def search_forest(estimator, param_grid, X, y, preprocessor, method="grid", cv=5, scoring=None,
+                  n_iter=20, factor=3, min_resources=20, n_jobs=-1, random_state=42):
+    """
+    Cross-validated hyperparameter search with preprocessing fitted once per fold.
+
+    The preprocessor is fitted on each training fold a single time and the
+    transformed folds are shared by every candidate, so only the estimator is
+    refitted per (candidate, fold). Those fits run in parallel through joblib.
+
+    Parameters:
+        estimator: Unfitted sklearn estimator to tune
+        param_grid (dict): Parameter name -> list of values
+        X (pd.DataFrame): Raw training features
+        y (array-like): Training targets
+        preprocessor: Unfitted transformer applied to X before the estimator
+        method (str): "grid" (every combination), "random" (n_iter sampled combinations)
+            or "halving" (successive halving over the number of training rows)
+        cv (int or splitter): Cross-validation strategy, as in sklearn
+        scoring (str or callable): Scorer; defaults to the estimator's own score method
+        n_iter (int): Candidates sampled by random search
+        factor (int): Halving keeps the best 1/factor candidates and multiplies rows by factor each round
+        min_resources (int): Training rows per fold in the first halving round
+        n_jobs (int): Parallel jobs for the candidate fits (-1 = all cores)
+        random_state (int): Seed for sampling candidates and halving subsets
+
+    Returns:
+        dict: best_params, best_score, best_estimator and preprocessor (both refitted on all of X),
+              results (one dict per evaluated candidate and round) and total_seconds
+    """
+    if method not in SEARCH_METHODS:
+        raise ValueError(f"Unsupported search method: {method}")
+
+    start = time.perf_counter()
+    candidates = _candidates(param_grid, method, n_iter, random_state)
+    folds = _prepare_folds(X, y, preprocessor, check_cv(cv, y, classifier=is_classifier(estimator)))
+    scorer = check_scoring(estimator, scoring=scoring)
+    base = _single_threaded(estimator)
+    print(f"🔍 {method} search: {len(candidates)} candidates × {len(folds)} folds")
+
+    if method == "halving":
+        results = _successive_halving(base, candidates, folds, scorer, factor, min_resources, n_jobs, random_state)
+    else:
+        results = _evaluate(base, candidates, folds, scorer, n_jobs)
+
+    final = [r for r in results if r["n_resources"] == max(r["n_resources"] for r in results)]
+    best = max(final, key=lambda r: r["mean_score"])
+
+    # Refit the winner on all rows, with the caller's parallelism settings
+    fitted_preprocessor = clone(preprocessor)
+    best_estimator = clone(estimator).set_params(**best["params"])
+    best_estimator.fit(fitted_preprocessor.fit_transform(X), y)
+
+    return {
+        "method": method,
+        "best_params": best["params"],
+        "best_score": best["mean_score"],
+        "best_estimator": best_estimator,
+        "preprocessor": fitted_preprocessor,
+        "results": results,
+        "total_seconds": time.perf_counter() - start,
+    }
+
+
+def print_search_results(search, top=10):
+    """Print the best candidates of a search_forest result with their wall-clock time."""
+    final_resources = max(r["n_resources"] for r in search["results"])
+    ranked = sorted(search["results"], key=lambda r: (r["n_resources"] == final_resources, r["mean_score"]),
+                    reverse=True)
+    print(f"\n⏱️ Search finished in {search['total_seconds']:.1f}s ({len(search['results'])} candidate evaluations)")
+    print(f"{'score':>9}{'± std':>8}{'rows':>7}{'seconds':>9}  params")
+    for r in ranked[:top]:
+        print(f"{r['mean_score']:>9.4f}{r['std_score']:>8.4f}{r['n_resources']:>7}{r['seconds']:>9.2f}  {r['params']}")
+    print(f"🏆 Best: {search['best_params']} (score {search['best_score']:.4f})")
+
+
+def search_report(search):
+    """JSON-serializable summary of a search_forest result."""
+    return {
+        "method": search["method"],
+        "best_params": search["best_params"],
+        "best_score": search["best_score"],
+        "total_seconds": search["total_seconds"],
+        "results": search["results"],
+    }
+
+
+def _candidates(param_grid, method, n_iter, random_state):
+    grid = ParameterGrid(param_grid)
+    if method == "random" and n_iter < len(grid):
+        return list(ParameterSampler(param_grid, n_iter=n_iter, random_state=random_state))
+    return list(grid)
+
+
+def _single_threaded(estimator):
+    # Parallelism comes from running candidates side by side, not from the forest itself
+    nested = {name: 1 for name in estimator.get_params() if name == "n_jobs" or name.endswith("__n_jobs")}
+    return clone(estimator).set_params(**nested)
+
+
+def _prepare_folds(X, y, preprocessor, cv):
+    y = np.asarray(y)
+    folds = []
+    for train, test in cv.split(X, y):
+        fold_preprocessor = clone(preprocessor)
+        X_train = fold_preprocessor.fit_transform(_take(X, train))
+        X_test = fold_preprocessor.transform(_take(X, test))
+        folds.append((X_train, y[train], X_test, y[test]))
+    return folds
+
+
+def _take(X, rows):
+    return X.iloc[rows] if hasattr(X, "iloc") else X[rows]
+
+
+def _fit_and_score(estimator, params, fold, scorer, train_rows=None):
+    X_train, y_train, X_test, y_test = fold
+    if train_rows is not None:
+        X_train, y_train = X_train[train_rows], y_train[train_rows]
+    start = time.perf_counter()
+    model = clone(estimator).set_params(**params).fit(X_train, y_train)
+    score = scorer(model, X_test, y_test)
+    return score, time.perf_counter() - start
+
+
+def _evaluate(estimator, candidates, folds, scorer, n_jobs, subsets=None):
+    subsets = subsets or [None] * len(folds)
+    outputs = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_and_score)(estimator, params, fold, scorer, rows)
+        for params in candidates
+        for fold, rows in zip(folds, subsets)
+    )
+
+    n_resources = len(folds[0][1]) if subsets[0] is None else len(subsets[0])
+    results = []
+    for i, params in enumerate(candidates):
+        scores, seconds = zip(*outputs[i * len(folds):(i + 1) * len(folds)])
+        results.append({
+            "params": params,
+            "mean_score": float(np.mean(scores)),
+            "std_score": float(np.std(scores)),
+            "seconds": float(np.sum(seconds)),
+            "n_resources": n_resources,
+        })
+    return results
+
+
+def _successive_halving(estimator, candidates, folds, scorer, factor, min_resources, n_jobs, random_state):
+    rng = np.random.RandomState(random_state)
+    orders = [rng.permutation(len(fold[1])) for fold in folds]
+    max_resources = min(len(order) for order in orders)
+    n_rounds = max(1, math.ceil(math.log(len(candidates), factor)))
+    resources = max(min_resources, max_resources // factor ** (n_rounds - 1))
+
+    results = []
+    while True:
+        resources = min(resources, max_resources)
+        subsets = [order[:resources] for order in orders]
+        round_results = _evaluate(estimator, candidates, folds, scorer, n_jobs, subsets)
+        results.extend(round_results)
+        print(f"   round with {resources} rows/fold: {len(candidates)} candidates")
+        if len(candidates) == 1 or resources == max_resources:
+            return results
+        keep = max(1, len(candidates) // factor)
+        ranked = sorted(round_results, key=lambda r: r["mean_score"], reverse=True)
+        candidates = [r["params"] for r in ranked[:keep]]
+        resources *= factor
@@ -0,0 +1,234 @@
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+
+class MicroBatcher:
+    """
+    Group concurrent prediction requests into one vectorized call.
+
+    Requests are queued. A worker thread takes the first waiting request, keeps
+    collecting until `max_batch_size` rows are gathered or `max_latency_ms` has
+    passed, then runs `predict_batch` once on all rows and hands each request its slice.
+
+    Parameters:
+        predict_batch (callable): list of input dicts -> list of outputs, one per row
+        max_batch_size (int): Row count that triggers a batch immediately
+        max_latency_ms (float): Longest time the first request of a batch waits for company
+    """
+
+    def __init__(self, predict_batch, max_batch_size=64, max_latency_ms=2.0):
+        self.predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "rows": 0, "batches": 0, "errors": 0, "predict_seconds": 0.0}
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def submit(self, rows):
+        """
+        Queue rows for prediction.
+
+        Parameters:
+            rows (list of dict): Inputs for one request
+
+        Returns:
+            concurrent.futures.Future: Resolves to the list of outputs for these rows
+        """
+        future = Future()
+        self._queue.put((rows, future))
+        return future
+
+    def _run(self):
+        while True:
+            pending = [self._queue.get()]
+            n_rows = len(pending[0][0])
+            deadline = time.perf_counter() + self.max_latency
+            while n_rows < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                pending.append(item)
+                n_rows += len(item[0])
+            self._process(pending, n_rows)
+
+    def _process(self, pending, n_rows):
+        rows = [row for request_rows, _ in pending for row in request_rows]
+        start = time.perf_counter()
+        try:
+            outputs = self.predict_batch(rows)
+        except Exception:
+            # One bad request must not fail the others: retry each request on its own
+            outputs = None
+        elapsed = time.perf_counter() - start
+
+        errors = 0
+        offset = 0
+        for request_rows, future in pending:
+            if outputs is not None:
+                future.set_result(outputs[offset:offset + len(request_rows)])
+            else:
+                try:
+                    future.set_result(self.predict_batch(request_rows))
+                except Exception as e:
+                    errors += 1
+                    future.set_exception(e)
+            offset += len(request_rows)
+
+        with self._lock:
+            self.stats["requests"] += len(pending)
+            self.stats["rows"] += n_rows
+            self.stats["batches"] += 1
+            self.stats["errors"] += errors
+            self.stats["predict_seconds"] += elapsed
+
+    def metrics(self):
+        """Return a snapshot of the batching counters."""
+        with self._lock:
+            stats = dict(self.stats)
+        stats["queued"] = self._queue.qsize()
+        stats["mean_batch_rows"] = stats["rows"] / stats["batches"] if stats["batches"] else 0.0
+        return stats
+
+
+def _printability_batch(rows):
+    from src.predict import predict_printability_batch
+    return [int(p) for p in predict_printability_batch(rows)]
+
+
+def _degradation_batch(rows):
+    from degradation_project.predict import predict_degradation_batch
+    columns = predict_degradation_batch(rows, as_frame=False)
+    return [{name: float(values[i]) for name, values in columns.items()} for i in range(len(rows))]
+
+
+def warm_up_models():
+    """Load both models so the first request does not pay for it."""
+    from src.predict import warm_up as warm_up_printability
+    from degradation_project.predict import warm_up as warm_up_degradation
+    warm_up_printability()
+    warm_up_degradation()
+
+
+class PredictionHandler(BaseHTTPRequestHandler):
+    """
+    JSON endpoints:
+        POST /predict/printability  body: one input object, a list, or {"inputs": [...]}
+        POST /predict/degradation   same body format
+        GET  /health
+        GET  /metrics
+    """
+
+    protocol_version = "HTTP/1.1"  # keep-alive, so clients can reuse connections
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+    batchers = {}
+    memos = {}
+    started = time.time()
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send(200, {"status": "ok", "models": sorted(self.batchers)})
+        elif self.path == "/metrics":
+            self._send(200, {
+                "uptime_seconds": round(time.time() - self.started, 3),
+                "models": {name: batcher.metrics() for name, batcher in self.batchers.items()},
+                "prediction_cache": {name: memo.stats() for name, memo in self.memos.items()},
+            })
+        else:
+            self._send(404, {"error": f"Unknown path: {self.path}"})
+
+    def do_POST(self):
+        name = self.path.rsplit("/", 1)[-1] if self.path.startswith("/predict/") else None
+        if name not in self.batchers:
+            self._send(404, {"error": f"Unknown path: {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"null")
+        except (ValueError, json.JSONDecodeError) as e:
+            self._send(400, {"error": f"Invalid JSON body: {e}"})
+            return
+
+        single = isinstance(body, dict) and "inputs" not in body
+        rows = [body] if single else body.get("inputs") if isinstance(body, dict) else body
+        if not isinstance(rows, list) or not rows or not all(isinstance(r, dict) for r in rows):
+            self._send(400, {"error": "Body must be an input object, a list of objects, or {'inputs': [...]}"})
+            return
+
+        try:
+            outputs = self.batchers[name].submit(rows).result()
+        except Exception as e:
+            self._send(422, {"error": f"Prediction failed: {e}"})
+            return
+
+        if single:
+            self._send(200, {"prediction": outputs[0]})
+        else:
+            self._send(200, {"predictions": outputs})
+
+    def _send(self, status, payload):
+        body = json.dumps(payload, default=_to_json).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # per-request logging would dominate at high request rates
+
+
+def _to_json(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class InferenceServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # the default backlog of 5 drops connections under load
+
+
+def create_server(host="127.0.0.1", port=8000, max_batch_size=64, max_latency_ms=2.0,
+                  memo=True, memo_size=4096, memo_path=None):
+    """
+    Build the inference server with one micro-batcher per model.
+
+    Parameters:
+        host (str): Interface to bind
+        port (int): Port to bind (0 picks a free one)
+        max_batch_size (int): Rows that trigger a batch immediately
+        max_latency_ms (float): Batching window for the first request of a batch
+        memo (bool): Serve repeated inputs from the prediction cache (src/memo.py)
+        memo_size (int): Entries the prediction cache keeps in memory per model
+        memo_path (str): Optional SQLite file for an on-disk cache tier shared by both models
+
+    Returns:
+        InferenceServer
+    """
+    predictors = {"printability": _printability_batch, "degradation": _degradation_batch}
+    memos = {}
+    if memo:
+        from src.memo import get_memo
+        memos = {name: get_memo(name, memo_size, memo_path) for name in predictors}
+    handler = type("Handler", (PredictionHandler,), {
+        "batchers": {
+            name: MicroBatcher(memos[name].predict_many if memo else predict, max_batch_size, max_latency_ms)
+            for name, predict in predictors.items()
+        },
+        "memos": memos,
+        "started": time.time(),
+    })
+    return InferenceServer((host, port), handler)
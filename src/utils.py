@@ -1,5 +1,5 @@
 import os
-import matplotlib.pyplot as plt
+import sys
 import numpy as np
 import random
 
@@ -24,22 +24,25 @@ def save_plot(fig, path, tight_layout=True):
 
 def set_seed(seed=42):
     """
-    Set random seed across numpy, random, and torch (if available).
+    Set random seed across numpy, random, and torch (if the program has imported it).
+
+    torch is not imported just to seed it: that alone takes seconds, and
+    nothing in this project uses it.
 
     Parameters:
         seed (int): Random seed value
     """
     np.random.seed(seed)
     random.seed(seed)
-    try:
-        import torch
+    torch = sys.modules.get("torch")
+    if torch is not None:
         torch.manual_seed(seed)
         torch.cuda.manual_seed_all(seed)
         torch.backends.cudnn.deterministic = True
         torch.backends.cudnn.benchmark = False
         print("🔒 PyTorch seed set.")
-    except ImportError:
-        print("ℹ️ PyTorch not installed — skipping torch seed.")
+    else:
+        print("ℹ️ PyTorch not in use — skipping torch seed.")
 
 
 def ensure_dir(directory):
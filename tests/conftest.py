@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Make the repo root importable so tests resolve `src` and `degradation_project` like the scripts do
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
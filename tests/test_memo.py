@@ -0,0 +1,54 @@
+from src.memo import PredictionMemo
+
+
+def make_memo(tmp_path, name, calls):
+    model_file = tmp_path / f"{name}.pkl"
+    if not model_file.exists():
+        model_file.write_bytes(name.encode())
+
+    def predict(row):
+        calls.append(row)
+        return f"{name}:{row['x']}"
+
+    return PredictionMemo(predict, {"x": 0.1}, [str(model_file)], disk_path=str(tmp_path / "memo.sqlite"),
+                          name=name)
+
+
+def test_memos_sharing_a_disk_file_keep_each_others_entries(tmp_path):
+    calls = []
+    first = make_memo(tmp_path, "printability", calls)
+    second = make_memo(tmp_path, "degradation", calls)
+    assert first({"x": 1.0}) == "printability:1.0"
+    assert second({"x": 1.0}) == "degradation:1.0"
+    assert first.stats()["disk_size"] == 1
+    assert second.stats()["disk_size"] == 1
+
+    # A restart: fresh memos on the same file answer from disk without predicting
+    calls.clear()
+    first = make_memo(tmp_path, "printability", calls)
+    second = make_memo(tmp_path, "degradation", calls)
+    assert first({"x": 1.0}) == "printability:1.0"
+    assert second({"x": 1.0}) == "degradation:1.0"
+    assert calls == []
+    assert first.stats()["disk_hits"] == 1
+    assert second.stats()["disk_hits"] == 1
+
+    first.clear()
+    assert first.stats()["disk_size"] == 0
+    assert second.stats()["disk_size"] == 1
+
+
+def test_inputs_are_predicted_as_given(tmp_path):
+    calls = []
+    memo = PredictionMemo(lambda row: calls.append(dict(row)) or len(calls), {"PS": 1, "LH": 0.01},
+                          [str(tmp_path / "missing.pkl")])
+    rows = [{"PS": 0.4, "LH": 0.3}, {"PS": 0, "LH": 0.3}, {"PS": 2.5, "LH": 0.3}, {"PS": 2, "LH": 0.3},
+            {"PS": None, "LH": float("nan")}]
+    assert memo.predict_many(rows) == [1, 2, 3, 4, 5]
+    assert calls[:4] == rows[:4]
+    assert calls[4]["PS"] is None
+
+    # Grid values match through float noise; missing values share a key
+    assert memo({"PS": 2.0, "LH": 0.1 + 0.2}) == 4
+    assert memo({"PS": None, "LH": float("nan")}) == 5
+    assert len(calls) == 5
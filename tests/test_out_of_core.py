@@ -0,0 +1,33 @@
+import os
+
+import numpy as np
+
+from src.data_preprocessing import load_data, preprocess_data
+from src.out_of_core import fit_preprocessor_chunked, transform_to_memmap
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "dataset-latest.csv")
+
+
+def test_first_row_with_missing_numerics(tmp_path):
+    df = load_data(DATA_PATH)
+    df.loc[0, ["TG_min", "Gelatin_pct"]] = np.nan
+    path = tmp_path / "dataset.csv"
+    df.to_csv(path, index=False)
+
+    fitted = fit_preprocessor_chunked(str(path), "Printable", chunksize=50)
+    X_train, X_test, y_train, y_test = transform_to_memmap(
+        str(path), fitted["preprocessor"], "Printable", fitted["n_rows"], str(tmp_path / "arrays"), chunksize=50)
+
+    expected = preprocess_data(load_data(str(path)), "Printable")
+    preprocessor, reference = fitted["preprocessor"], expected[4]
+    num, reference_num = preprocessor.named_transformers_["num"], reference.named_transformers_["num"]
+    assert np.allclose(num["imputer"].statistics_, reference_num["imputer"].statistics_)
+    assert np.allclose(num["scaler"].mean_, reference_num["scaler"].mean_)
+    assert np.allclose(num["scaler"].scale_, reference_num["scaler"].scale_)
+    assert (preprocessor.named_transformers_["cat"]["imputer"].statistics_.tolist()
+            == reference.named_transformers_["cat"]["imputer"].statistics_.tolist())
+
+    for actual, wanted in zip((X_train, X_test, y_train, y_test), expected[:4]):
+        wanted = wanted.toarray() if hasattr(wanted, "toarray") else np.asarray(wanted)
+        assert actual.shape == wanted.shape
+        assert np.allclose(actual, wanted.astype(actual.dtype), atol=1e-6)
@@ -0,0 +1,30 @@
+import pytest
+
+from benchmarks.check_startup import BUDGETS_MS, forbidden_imports, measure
+
+# Budgets are set on a single-core development machine; CI runners are noisier
+SCALE = 2.0
+
+
+@pytest.fixture(scope="module", autouse=True)
+def warm_bytecode_cache():
+    measure("frontend/app.py", 1)
+
+
+@pytest.mark.parametrize("entry_point", sorted(BUDGETS_MS))
+def test_import_time_within_budget(entry_point):
+    total, _ = measure(entry_point, repeats=3)
+    assert total <= BUDGETS_MS[entry_point] * SCALE, (
+        f"{entry_point} imports in {total:.0f} ms, over {SCALE}x its {BUDGETS_MS[entry_point]} ms budget")
+
+
+@pytest.mark.parametrize("entry_point", sorted(BUDGETS_MS))
+def test_no_forbidden_imports(entry_point):
+    _, modules = measure(entry_point, repeats=1)
+    assert forbidden_imports(entry_point, modules) == []
+
+
+def test_forbidden_imports_are_detected():
+    modules = {"pandas": (1.0, 1.0, 0), "sklearn.ensemble._forest": (1.0, 1.0, 1), "seaborn": (1.0, 1.0, 0)}
+    assert forbidden_imports("frontend/app.py", modules) == ["seaborn", "sklearn.ensemble._forest"]
+    assert forbidden_imports("main.py", modules) == ["seaborn"]